@@ -3,6 +3,10 @@ Module containing data for F1 2025 drivers with their attributes and statistics.
 """
 
 class Driver:
+    __slots__ = ("name", "team", "number", "nationality", "age", "experience",
+                 "skill_wet", "skill_dry", "skill_overtaking", "consistency", "aggression",
+                 "_overall", "_name_lc", "_str")
+
     def __init__(self, name, team, number, nationality, age, experience, 
                  skill_wet, skill_dry, skill_overtaking, consistency, aggression):
         self.name = name
@@ -16,17 +20,21 @@ class Driver:
         self.skill_overtaking = skill_overtaking  # Overtaking ability (1-100)
         self.consistency = consistency  # Consistency during race (1-100)
         self.aggression = aggression  # Aggressive driving style (1-100)
+        self._name_lc = name.lower()
+        self._str = f"{name} ({team})"
+        # Driver attributes don't change during a season, so the rating is computed once
+        self._overall = (skill_dry * 0.35 +
+                         skill_wet * 0.15 +
+                         skill_overtaking * 0.20 +
+                         consistency * 0.20 +
+                         experience * 0.10)
         
     def __str__(self):
-        return f"{self.name} ({self.team})"
+        return self._str
     
     def get_overall_rating(self):
-        """Calculate the overall driver rating based on their skills."""
-        return (self.skill_dry * 0.35 + 
-                self.skill_wet * 0.15 + 
-                self.skill_overtaking * 0.20 + 
-                self.consistency * 0.20 + 
-                self.experience * 0.10)
+        """Return the overall driver rating based on their skills."""
+        return self._overall
 
 
 # 2025 F1 Drivers with realistic attributes
@@ -54,13 +62,35 @@ DRIVERS = {
     "bearman": Driver("Oliver Bearman", "Haas", 50, "British", 20, 1, 83, 86, 84, 80, 85)
 }
 
+# Lowercase team name -> drivers, in DRIVERS order
+_TEAM_INDEX = {}
+for _driver in DRIVERS.values():
+    _TEAM_INDEX.setdefault(_driver.team.lower(), []).append(_driver)
+_TEAM_NAMES_LC = list(_TEAM_INDEX.keys())
+
+
+def _find_driver_by_substring(name):
+    """Return the first driver whose lowercase name contains `name`."""
+    for driver in DRIVERS.values():
+        if name in driver._name_lc:
+            return driver
+    return None
+
+# Lookup table for the common queries: driver id, full name and surname.
+# Values come from the substring scan itself so hits match its answer exactly.
+_NAME_INDEX = {}
+for _driver_id, _driver in DRIVERS.items():
+    for _key in (_driver_id, _driver._name_lc, _driver._name_lc.split()[-1]):
+        if _key not in _NAME_INDEX:
+            _NAME_INDEX[_key] = _find_driver_by_substring(_key)
+
 def get_driver_by_name(name):
     """Get a driver by their full or partial name."""
     name = name.lower()
-    for driver_id, driver in DRIVERS.items():
-        if name in driver.name.lower():
-            return driver
-    return None
+    driver = _NAME_INDEX.get(name)
+    if driver is not None:
+        return driver
+    return _find_driver_by_substring(name)
 
 def get_all_drivers():
     """Return all drivers."""
@@ -69,4 +99,8 @@ def get_all_drivers():
 def get_drivers_by_team(team_name):
     """Get all drivers from a specific team."""
     team_name = team_name.lower()
-    return [driver for driver in DRIVERS.values() if team_name in driver.team.lower()]
\ No newline at end of file
+    drivers = _TEAM_INDEX.get(team_name)
+    if drivers is not None:
+        return list(drivers)
+    # Partial team name, e.g. "bull"
+    return [driver for team in _TEAM_NAMES_LC if team_name in team for driver in _TEAM_INDEX[team]]
@@ -11,57 +11,91 @@ This application simulates F1 race results based on:
 
 import os
 import sys
-import random
-import argparse
-from tabulate import tabulate as tabulate_func  # Import and rename for clarity
+import functools
+import importlib.util
 
 # Import our data models
-from data.drivers import get_all_drivers, get_driver_by_name
-from data.teams import get_all_teams, get_team_by_name
-from data.tracks import get_all_tracks, get_track_by_name, get_calendar
+from data.drivers import get_all_drivers
+from data.teams import get_all_teams
+from data.tracks import get_calendar
 
 # Import our simulation models
 from models.race_model import RaceSimulator
 from models.weather import generate_weather
-from models.strategy import TireCompound, get_tire_strategy
 
-# Import visualization and stats utilities
+# Import display utilities. The graph, stats and tabulate modules pull in
+# pandas/seaborn and are imported inside the menu branches that use them.
 from utils.visualization import (
     display_race_header, display_qualifying_results, display_race_results,
     plot_race_progress, simulate_live_race_progress
 )
-from utils.visualization_graphs import (
-    plot_tire_degradation, plot_lap_time_progression,
-    plot_driver_comparison, plot_team_performance,
-    generate_all_visualizations
+
+REQUIRED_PACKAGES = ("numpy", "pandas", "matplotlib", "tabulate", "colorama", "seaborn")
+
+
+# Static menu text, each written to stdout in a single call
+_WELCOME_TEXT = (
+    "\n" + "=" * 80 + "\n"
+    "FORMULA 1 RACE PREDICTION SIMULATOR - 2025 SEASON\n"
+    + "=" * 80 + "\n"
+    "This application simulates F1 race outcomes based on driver skills, car performance,\n"
+    "track characteristics, and variable weather conditions.\n"
+    "\nAll data is fictional and represents a hypothetical 2025 F1 season.\n"
+    + "=" * 80 + "\n\n"
+)
+
+_WEATHER_MENU = (
+    "\nChoose weather conditions for the race:\n"
+    "1. Realistic (based on track location and season)\n"
+    "2. Dry race\n"
+    "3. Wet race\n"
+    "4. Mixed conditions\n"
+)
+
+_ANALYSIS_MENU = (
+    "\nAnalysis Options:\n"
+    "1. Show qualifying vs race performance analysis\n"
+    "2. Show detailed race statistics\n"
+    "3. Visualize basic race progress\n"
+    "4. Generate advanced visualizations\n"
+    "5. Generate all visualizations (saves to visualized-graphs folder)\n"
+    "6. Simulate another race\n"
+    "7. Quit\n"
+)
+
+_VISUALIZATION_MENU = (
+    "\nAdvanced Visualization Options:\n"
+    "1. Tire degradation chart\n"
+    "2. Lap time progression\n"
+    "3. Driver performance comparison\n"
+    "4. Team performance analysis\n"
+    "5. Return to main menu\n"
 )
-from utils.stats import SeasonStats, analyze_qualifying_performance, calculate_performance_metrics
 
 
 def print_welcome():
     """Print welcome message with app information."""
-    print("\n" + "=" * 80)
-    print("FORMULA 1 RACE PREDICTION SIMULATOR - 2025 SEASON")
-    print("=" * 80)
-    print("This application simulates F1 race outcomes based on driver skills, car performance,")
-    print("track characteristics, and variable weather conditions.")
-    print("\nAll data is fictional and represents a hypothetical 2025 F1 season.")
-    print("=" * 80 + "\n")
+    sys.stdout.write(_WELCOME_TEXT)
+
+
+@functools.lru_cache(maxsize=1)
+def _calendar_table():
+    """Build the race calendar and its rendered selection table once."""
+    from tabulate import tabulate as tabulate_func
+
+    tracks = get_calendar()
+    table_data = [[i, track.name, track.country, track.date] for i, track in enumerate(tracks, 1)]
+    headers = ["Option", "Circuit", "Country", "Race Date"]
+    return tracks, tabulate_func(table_data, headers=headers, tablefmt="pipe")
 
 
 def select_track():
     """Prompt user to select a track from the 2025 calendar."""
-    tracks = get_calendar()
+    tracks, rendered_table = _calendar_table()
     
     print("\nAvailable races in the 2025 F1 Calendar:")
     print("-" * 60)
-    
-    table_data = []
-    for i, track in enumerate(tracks, 1):
-        table_data.append([i, track.name, track.country, track.date])
-    
-    headers = ["Option", "Circuit", "Country", "Race Date"]
-    print(tabulate_func(table_data, headers=headers, tablefmt="pipe"))
+    print(rendered_table)
     
     while True:
         try:
@@ -78,32 +112,30 @@ def select_track():
             print("Please enter a valid number")
 
 
+# Menu option -> forced weather condition (None means realistic weather)
+_WEATHER_OPTIONS = {
+    1: None,
+    2: "dry",
+    3: "wet",
+    4: "mixed"
+}
+
+
 def select_weather_option(track):
     """Allow user to choose weather options."""
-    print("\nChoose weather conditions for the race:")
-    print("1. Realistic (based on track location and season)")
-    print("2. Dry race")
-    print("3. Wet race")
-    print("4. Mixed conditions")
+    sys.stdout.write(_WEATHER_MENU)
     
     while True:
         choice = input("\nSelect an option (1-4): ")
         
         # Strip any whitespace and check if it's a digit
         choice = choice.strip()
-        if choice.isdigit():
+        if choice.isdecimal():
             choice_num = int(choice)
             
-            if choice_num == 1:
-                return generate_weather(track)
-            elif choice_num == 2:
-                return generate_weather(track, forced_condition="dry")
-            elif choice_num == 3:
-                return generate_weather(track, forced_condition="wet")
-            elif choice_num == 4:
-                return generate_weather(track, forced_condition="mixed")
-            else:
-                print("Please enter a number between 1 and 4")
+            if choice_num in _WEATHER_OPTIONS:
+                return generate_weather(track, forced_condition=_WEATHER_OPTIONS[choice_num])
+            print("Please enter a number between 1 and 4")
         else:
             print("Please enter a valid number (1-4)")
 
@@ -133,118 +165,146 @@ def run_race_simulation(track, weather_option):
     return simulator, qualifying_results, race_results
 
 
+def _show_qualifying_analysis(track, qualifying_results, race_results):
+    """Print qualifying vs race position changes."""
+    from tabulate import tabulate as tabulate_func
+    from utils.stats import analyze_qualifying_performance
+    analysis_df = analyze_qualifying_performance(qualifying_results, race_results)
+    print("\nQualifying vs Race Performance:")
+    print(tabulate_func(analysis_df, headers='keys', tablefmt='pipe', showindex=False))
+
+
+def _show_race_statistics(track, qualifying_results, race_results):
+    """Print summary statistics for the race."""
+    from utils.stats import calculate_performance_metrics
+    metrics = calculate_performance_metrics(race_results)
+    print("\nRace Statistics:")
+    for key, value in metrics.items():
+        if isinstance(value, float):
+            print(f"{key}: {value:.2f}")
+        else:
+            print(f"{key}: {value}")
+
+
+def _show_race_progress(track, qualifying_results, race_results):
+    """Plot race progress and replay the race in the console."""
+    print("\nGenerating race progress visualization...")
+    plot_race_progress(race_results, track.laps)
+    simulate_live_race_progress(race_results, track.laps, track.name)
+
+
+def _show_advanced_visualizations(track, qualifying_results, race_results):
+    """Open the advanced visualization submenu."""
+    show_visualization_menu(race_results, track)
+
+
+def _generate_all_visualizations(track, qualifying_results, race_results):
+    """Generate every graph type into the visualized-graphs folder."""
+    from utils.visualization_graphs import generate_all_visualizations
+    print("\nGenerating all visualizations...")
+    visualizations = generate_all_visualizations(race_results, track.laps, track.name)
+    print("\nAll visualizations saved to the 'visualized-graphs' folder:")
+    for viz_type, path in visualizations.items():
+        print(f"- {viz_type}: {os.path.basename(path)}")
+
+
+_ANALYSIS_HANDLERS = {
+    1: _show_qualifying_analysis,
+    2: _show_race_statistics,
+    3: _show_race_progress,
+    4: _show_advanced_visualizations,
+    5: _generate_all_visualizations
+}
+
+# Options that leave the analysis menu -> whether to simulate another race
+_ANALYSIS_EXITS = {
+    6: True,
+    7: False
+}
+
+
 def show_analysis_menu(simulator, qualifying_results, race_results):
     """Show menu for additional analysis options."""
     track = simulator.track
     
     while True:
-        print("\nAnalysis Options:")
-        print("1. Show qualifying vs race performance analysis")
-        print("2. Show detailed race statistics")
-        print("3. Visualize basic race progress")
-        print("4. Generate advanced visualizations")
-        print("5. Generate all visualizations (saves to visualized-graphs folder)")
-        print("6. Simulate another race")
-        print("7. Quit")
+        sys.stdout.write(_ANALYSIS_MENU)
         
-        try:
-            choice = input("\nSelect an option (1-7): ")
-            choice = int(choice)
-            
-            if choice == 1:
-                # Qualifying vs race analysis
-                analysis_df = analyze_qualifying_performance(qualifying_results, race_results)
-                print("\nQualifying vs Race Performance:")
-                print(tabulate_func(analysis_df, headers='keys', tablefmt='pipe', showindex=False))
-                
-            elif choice == 2:
-                # Race statistics
-                metrics = calculate_performance_metrics(race_results)
-                print("\nRace Statistics:")
-                for key, value in metrics.items():
-                    if isinstance(value, float):
-                        print(f"{key}: {value:.2f}")
-                    else:
-                        print(f"{key}: {value}")
-                        
-            elif choice == 3:
-                # Visualize race progress
-                print("\nGenerating race progress visualization...")
-                plot_race_progress(race_results, track.laps)
-                simulate_live_race_progress(race_results, track.laps, track.name)
-                
-            elif choice == 4:
-                # Advanced visualizations submenu
-                show_visualization_menu(race_results, track)
-                
-            elif choice == 5:
-                # Generate all visualizations
-                print("\nGenerating all visualizations...")
-                visualizations = generate_all_visualizations(race_results, track.laps, track.name)
-                print("\nAll visualizations saved to the 'visualized-graphs' folder:")
-                for viz_type, path in visualizations.items():
-                    print(f"- {viz_type}: {os.path.basename(path)}")
-                
-            elif choice == 6:
-                # Simulate another race
-                return True
-                
-            elif choice == 7:
-                return False
-                
-            else:
-                print("Please enter a number between 1 and 7")
-                
-        except ValueError:
+        choice = input("\nSelect an option (1-7): ").strip()
+        if not choice.isdecimal():
             print("Please enter a valid number")
+            continue
+        choice = int(choice)
+        
+        if choice in _ANALYSIS_EXITS:
+            return _ANALYSIS_EXITS[choice]
+        
+        handler = _ANALYSIS_HANDLERS.get(choice)
+        if handler is None:
+            print("Please enter a number between 1 and 7")
+            continue
+        handler(track, qualifying_results, race_results)
+
+
+def _plot_tire_degradation(race_results, track):
+    from utils.visualization_graphs import plot_tire_degradation
+    print("\nGenerating tire degradation visualization...")
+    path = plot_tire_degradation(track.laps, race_results, track.name)
+    print(f"Visualization saved to: {path}")
+
+
+def _plot_lap_times(race_results, track):
+    from utils.visualization_graphs import plot_lap_time_progression
+    print("\nGenerating lap time progression visualization...")
+    path = plot_lap_time_progression(race_results, track.laps, track.name)
+    print(f"Visualization saved to: {path}")
+
+
+def _plot_driver_comparison(race_results, track):
+    from utils.visualization_graphs import plot_driver_comparison
+    print("\nGenerating driver comparison visualizations...")
+    paths = plot_driver_comparison(race_results, track.name)
+    print("Visualizations saved to:")
+    for path in paths:
+        print(f"- {path}")
+
+
+def _plot_team_performance(race_results, track):
+    from utils.visualization_graphs import plot_team_performance
+    print("\nGenerating team performance visualizations...")
+    paths = plot_team_performance(race_results, track.name)
+    print("Visualizations saved to:")
+    for path in paths:
+        print(f"- {path}")
+
+
+_VISUALIZATION_HANDLERS = {
+    1: _plot_tire_degradation,
+    2: _plot_lap_times,
+    3: _plot_driver_comparison,
+    4: _plot_team_performance
+}
 
 
 def show_visualization_menu(race_results, track):
     """Show submenu for advanced visualization options."""
     while True:
-        print("\nAdvanced Visualization Options:")
-        print("1. Tire degradation chart")
-        print("2. Lap time progression")
-        print("3. Driver performance comparison")
-        print("4. Team performance analysis")
-        print("5. Return to main menu")
+        sys.stdout.write(_VISUALIZATION_MENU)
         
-        try:
-            choice = input("\nSelect visualization type (1-5): ")
-            choice = int(choice)
-            
-            if choice == 1:
-                print("\nGenerating tire degradation visualization...")
-                path = plot_tire_degradation(track.laps, race_results, track.name)
-                print(f"Visualization saved to: {path}")
-                
-            elif choice == 2:
-                print("\nGenerating lap time progression visualization...")
-                path = plot_lap_time_progression(race_results, track.laps, track.name)
-                print(f"Visualization saved to: {path}")
-                
-            elif choice == 3:
-                print("\nGenerating driver comparison visualizations...")
-                paths = plot_driver_comparison(race_results, track.name)
-                print(f"Visualizations saved to:")
-                for path in paths:
-                    print(f"- {path}")
-                    
-            elif choice == 4:
-                print("\nGenerating team performance visualizations...")
-                paths = plot_team_performance(race_results)
-                print(f"Visualizations saved to:")
-                for path in paths:
-                    print(f"- {path}")
-                    
-            elif choice == 5:
-                return
-                
-            else:
-                print("Please enter a number between 1 and 5")
-                
-        except ValueError:
+        choice = input("\nSelect visualization type (1-5): ").strip()
+        if not choice.isdecimal():
             print("Please enter a valid number")
+            continue
+        choice = int(choice)
+        
+        if choice == 5:
+            return
+        
+        handler = _VISUALIZATION_HANDLERS.get(choice)
+        if handler is None:
+            print("Please enter a number between 1 and 5")
+            continue
+        handler(race_results, track)
 
 
 def main():
@@ -275,19 +335,13 @@ def main():
 
 
 if __name__ == "__main__":
-    # Check for required packages
-    try:
-        import numpy
-        import pandas
-        import matplotlib
-        import tabulate
-        import colorama
-        import seaborn
-    except ImportError:
+    # Check for required packages without importing (and initializing) them
+    missing = [package for package in REQUIRED_PACKAGES
+               if importlib.util.find_spec(package) is None]
+    if missing:
         print("Missing required packages. Installing dependencies...")
         import subprocess
-        subprocess.call([sys.executable, "-m", "pip", "install", 
-                        "numpy", "pandas", "matplotlib", "tabulate", "colorama", "seaborn"])
+        subprocess.call([sys.executable, "-m", "pip", "install", *missing])
         print("Dependencies installed. Starting application...")
     
     main()
\ No newline at end of file
@@ -9,6 +9,8 @@ import numpy as np
 from dataclasses import dataclass
 from enum import Enum
 
+from models.strategy import LapEnv, PitStopSampler, PitStopStrategy, TireFleet
+
 
 class RaceIncident(Enum):
     """Types of incidents that can occur during a race."""
@@ -323,6 +325,18 @@ class RaceSimulator:
         
         driver_times = {driver: 0.0 for driver in self.grid_positions}
         
+        # Every car runs the strategy planned for the track and conditions
+        strategy = PitStopStrategy(self.track, self.weather, total_laps)
+        pit_plan = dict(strategy.generate_optimal_strategy())
+        
+        # Randomness for every stop in the race, drawn in one block
+        pit_stops = PitStopSampler(batch_size=max(len(pit_plan) * len(self.grid_positions), 1))
+        
+        # Tires for the whole field, one row per car in grid order
+        car_index = {driver: i for i, driver in enumerate(self.grid_positions)}
+        tires = TireFleet([strategy.starting_compound] * len(car_index), self.track)
+        lap_env = LapEnv.from_conditions(self.weather, self.track)
+        
         # Track the fastest lap
         fastest_lap = {'driver': None, 'time': float('inf')}
         
@@ -330,15 +344,16 @@ class RaceSimulator:
         for lap in range(1, total_laps + 1):
             active_drivers = [d for d in self.grid_positions if driver_status[d]['active']]
             
+            # Time lost to each car's tires this lap, then the wear from it
+            tire_effects = tires.get_pace_effects(lap_env).tolist()
+            tires.update_all(lap_env)
+            
             for driver in active_drivers:
                 team = self.driver_teams[driver]
                 
                 # Calculate base lap time
                 lap_time = self._calculate_race_pace(driver, team)
                 
-                # Adjust for tire wear - lap times increase as the race progresses
-                tire_degradation = 0.05 * (lap / 20) * (self.track.tyre_wear / 10)
-                
                 # Adjust for fuel load - cars get faster as fuel burns (about 0.2-0.3s improvement per 10 laps)
                 fuel_factor = -0.02 * (lap / 10)
                 
@@ -350,7 +365,8 @@ class RaceSimulator:
                 random_variation = random.uniform(-0.3, 0.3)
                 
                 # Final lap time
-                final_lap_time = lap_time * (1 + tire_degradation + fuel_factor + traffic_factor + random_variation)
+                final_lap_time = (lap_time * (1 + fuel_factor + traffic_factor + random_variation)
+                                  + tire_effects[car_index[driver]])
                 
                 # Check for fastest lap
                 if final_lap_time < fastest_lap['time']:
@@ -360,6 +376,11 @@ class RaceSimulator:
                 # Apply lap time to cumulative race time
                 driver_times[driver] += final_lap_time
                 
+                # Time lost in the pit lane on planned stops, leaving on new tires
+                if lap in pit_plan:
+                    driver_times[driver] += pit_stops.execute_pit_stop(lap)['time_lost']
+                    tires.fit_new_set(car_index[driver], pit_plan[lap])
+                
                 # Check for incidents
                 incident, description = self._simulate_incidents(driver, team, lap, total_laps)
                 if incident != RaceIncident.NONE:
@@ -3,7 +3,18 @@ Module for simulating F1 race strategies, pit stops, and tire management.
 """
 
 import random
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the NumPy code paths are used without it
+    njit = None
+
+HAS_NUMBA = njit is not None
 
 
 class TireCompound(Enum):
@@ -15,73 +26,85 @@ class TireCompound(Enum):
     WET = 5
 
 
+# Per-compound lookup tables indexed by compound id (TireCompound.value - 1)
+_BASE_PACE = (0.0, 0.4, 0.8, 2.0, 3.0)  # Seconds per lap slower than soft
+_BASE_DEG = (0.03, 0.022, 0.015, 0.025, 0.02)  # Degradation per lap
+_IS_SLICK = (True, True, True, False, False)
+
+
+@dataclass(frozen=True)
+class LapEnv:
+    """
+    Track and weather factors shared by every car on a given lap.
+    
+    Build it once per lap with LapEnv.from_conditions() and pass it to
+    the tire update/pace methods instead of re-deriving the same factors
+    from the weather object for every car.
+    """
+    __slots__ = ('is_wet', 'temp_factor', 'rain_intensity', 'track_factor')
+    is_wet: bool
+    temp_factor: float  # Degradation multiplier from track temperature
+    rain_intensity: float
+    track_factor: float  # Degradation multiplier from the track's tyre wear
+    
+    @classmethod
+    def from_conditions(cls, weather, track):
+        """Derive the lap environment from weather conditions and a track."""
+        temp = weather.track_temperature
+        temp_factor = 1.0
+        if temp > 45:  # Very hot track
+            temp_factor = 1.3
+        elif temp < 15:  # Very cold track
+            temp_factor = 0.8
+        
+        return cls(
+            is_wet=weather.is_wet,
+            temp_factor=temp_factor,
+            rain_intensity=weather.rain_intensity,
+            # High tyre wear tracks degrade tires faster (1-10 scale -> multiplier)
+            track_factor=track.tyre_wear / 5
+        )
+
+
+def _as_lap_env(track_conditions, track):
+    """Accept either a LapEnv or a legacy {'weather': ...} conditions dict."""
+    if isinstance(track_conditions, LapEnv):
+        return track_conditions
+    return LapEnv.from_conditions(track_conditions['weather'], track)
+
+
 class TireSet:
     """Represents a set of tires with degradation characteristics."""
     
+    __slots__ = ('compound', 'expected_life', 'current_age', 'degradation', 'track')
+    
     def __init__(self, compound, expected_life, track):
         self.compound = compound
         self.expected_life = expected_life  # Expected laps before significant degradation
         self.current_age = 0  # Current age in laps
         self.degradation = 0.0  # Current degradation level (0-1)
         self.track = track
-        
-        # Base pace factors for each compound (seconds per lap)
-        self.base_pace_factors = {
-            TireCompound.SOFT: 0.0,  # Baseline
-            TireCompound.MEDIUM: 0.4,  # 0.4s slower per lap than soft
-            TireCompound.HARD: 0.8,  # 0.8s slower per lap than soft
-            TireCompound.INTERMEDIATE: 2.0,  # Only for mixed conditions
-            TireCompound.WET: 3.0,  # Only for wet conditions
-        }
-        
-        # Base degradation rates for each compound
-        self.base_degradation_rates = {
-            TireCompound.SOFT: 0.03,  # 3% degradation per lap
-            TireCompound.MEDIUM: 0.022,  # 2.2% degradation per lap
-            TireCompound.HARD: 0.015,  # 1.5% degradation per lap
-            TireCompound.INTERMEDIATE: 0.025,  # Depends on conditions
-            TireCompound.WET: 0.02,  # Depends on conditions
-        }
     
-    def update(self, track_conditions):
+    def update(self, env):
         """
         Update tire state after a lap.
         
         Args:
-            track_conditions: Contains track status, weather, etc.
+            env: LapEnv for this lap (or a dict containing the weather)
         """
+        env = _as_lap_env(env, self.track)
+        compound_id = self.compound.value - 1
+        
         # Base degradation rate for the compound
-        base_rate = self.base_degradation_rates[self.compound]
+        base_rate = _BASE_DEG[compound_id]
         
-        # Adjust for track characteristics - high tyre wear tracks degrade tires faster
-        track_factor = self.track.tyre_wear / 5  # Convert 1-10 scale to something more manageable
+        # Adjust for weather - slicks in the wet and wet tires in the dry
+        # degrade extremely fast, matching tires degrade normally
+        slick = _IS_SLICK[compound_id]
+        weather_factor = 5.0 if env.is_wet and slick else (6.0 if not env.is_wet and not slick else 1.0)
         
-        # Adjust for weather
-        if track_conditions['weather'].is_wet:
-            if self.compound in [TireCompound.SOFT, TireCompound.MEDIUM, TireCompound.HARD]:
-                # Slicks in wet conditions degrade extremely fast
-                weather_factor = 5.0
-            else:
-                # Wet tires in wet conditions degrade normally
-                weather_factor = 1.0
-        else:
-            if self.compound in [TireCompound.INTERMEDIATE, TireCompound.WET]:
-                # Wet tires in dry conditions degrade extremely fast
-                weather_factor = 6.0
-            else:
-                # Slicks in dry conditions degrade normally
-                weather_factor = 1.0
-        
-        # Temperature effect
-        temp = track_conditions['weather'].track_temperature
-        temp_factor = 1.0
-        if temp > 45:  # Very hot track
-            temp_factor = 1.3
-        elif temp < 15:  # Very cold track
-            temp_factor = 0.8
-            
         # Calculate degradation for this lap
-        lap_degradation = base_rate * track_factor * weather_factor * temp_factor
+        lap_degradation = base_rate * env.track_factor * weather_factor * env.temp_factor
         
         # Apply degradation
         self.degradation += lap_degradation
@@ -89,18 +112,21 @@ class TireSet:
         
         return lap_degradation
     
-    def get_pace_effect(self, track_conditions):
+    def get_pace_effect(self, env):
         """
         Calculate the effect of tire state on lap time.
         
         Args:
-            track_conditions: Contains track and weather information
+            env: LapEnv for this lap (or a dict containing the weather)
             
         Returns:
             Time penalty in seconds for current tire state
         """
+        env = _as_lap_env(env, self.track)
+        compound_id = self.compound.value - 1
+        
         # Base effect from compound
-        base_effect = self.base_pace_factors[self.compound]
+        base_effect = _BASE_PACE[compound_id]
         
         # Effect from degradation (as tires wear, they get slower)
         # Exponential increase in time as degradation increases
@@ -108,16 +134,15 @@ class TireSet:
         degradation_effect = 3.0 * (self.degradation ** 2)
         
         # Weather condition effect - wrong tire in wrong conditions has massive impact
-        weather = track_conditions['weather']
-        if weather.is_wet:
-            if self.compound in [TireCompound.SOFT, TireCompound.MEDIUM, TireCompound.HARD]:
+        if env.is_wet:
+            if _IS_SLICK[compound_id]:
                 # Slicks in rain are dangerously slow
-                weather_effect = 10.0 + (weather.rain_intensity * 2)
+                weather_effect = 10.0 + (env.rain_intensity * 2)
             else:
                 # Appropriate tires
                 weather_effect = 0.0
         else:
-            if self.compound in [TireCompound.INTERMEDIATE, TireCompound.WET]:
+            if not _IS_SLICK[compound_id]:
                 # Rain tires in dry conditions are very slow
                 weather_effect = 5.0
             else:
@@ -127,9 +152,243 @@ class TireSet:
         return base_effect + degradation_effect + weather_effect
 
 
+# Array versions of the compound lookup tables for vectorized indexing
+BASE_PACE_FACTORS = np.array(_BASE_PACE, dtype=np.float32)
+BASE_DEGRADATION_RATES = np.array(_BASE_DEG, dtype=np.float32)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _tire_step(compound_id, track_factor, is_wet, temp_factor):
+        """Degradation added to one set of tires in one lap (TireSet.update)."""
+        slick = compound_id <= 2
+        if is_wet and slick:
+            weather_factor = 5.0
+        elif not is_wet and not slick:
+            weather_factor = 6.0
+        else:
+            weather_factor = 1.0
+        
+        return BASE_DEGRADATION_RATES[compound_id] * track_factor * weather_factor * temp_factor
+    
+    @njit(cache=True)
+    def _fleet_step(compounds, degradation, age, track_factor, is_wet, temp_factor):
+        """Advance every car's tires by one lap in place, return the per-car degradation."""
+        n = compounds.shape[0]
+        lap_degradation = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            lap_degradation[i] = _tire_step(compounds[i], track_factor, is_wet, temp_factor)
+            degradation[i] += lap_degradation[i]
+            age[i] += 1
+        return lap_degradation
+
+
+class TireFleet:
+    """
+    Tire state for a whole field of cars, stored as parallel arrays.
+
+    Vectorized counterpart of TireSet: one update_all() call advances every
+    car by a lap instead of calling TireSet.update() once per car.
+    """
+    
+    def __init__(self, compounds, track):
+        """
+        Initialize the fleet.
+        
+        Args:
+            compounds: Starting TireCompound for each car
+            track: Track object
+        """
+        self.compound = np.array([c.value - 1 for c in compounds], dtype=np.int8)
+        self.degradation = np.zeros(len(self.compound), dtype=np.float32)
+        self.age = np.zeros(len(self.compound), dtype=np.int32)
+        self.track = track
+    
+    def __len__(self):
+        return len(self.compound)
+    
+    def fit_new_set(self, car, compound):
+        """Fit a fresh set of tires to one car (e.g. after a pit stop)."""
+        self.compound[car] = compound.value - 1
+        self.degradation[car] = 0.0
+        self.age[car] = 0
+    
+    def update_all(self, env):
+        """
+        Update every car's tire state after a lap.
+        
+        Args:
+            env: LapEnv for this lap (or a dict containing the weather)
+            
+        Returns:
+            Array with the degradation added to each car this lap
+        """
+        env = _as_lap_env(env, self.track)
+        
+        if HAS_NUMBA:
+            return _fleet_step(self.compound, self.degradation, self.age,
+                               float(env.track_factor), bool(env.is_wet), float(env.temp_factor))
+        
+        # Wrong tires for the conditions degrade extremely fast
+        is_slick = self.compound <= 2
+        if env.is_wet:
+            weather_factor = np.where(is_slick, 5.0, 1.0)
+        else:
+            weather_factor = np.where(is_slick, 1.0, 6.0)
+        
+        lap_degradation = (BASE_DEGRADATION_RATES[self.compound] * weather_factor
+                           * (env.track_factor * env.temp_factor)).astype(np.float32)
+        
+        self.degradation += lap_degradation
+        self.age += 1
+        
+        return lap_degradation
+    
+    def get_pace_effects(self, env):
+        """
+        Calculate the effect of each car's tire state on lap time.
+        
+        Args:
+            env: LapEnv for this lap (or a dict containing the weather)
+            
+        Returns:
+            Array of time penalties in seconds, one per car
+        """
+        env = _as_lap_env(env, self.track)
+        is_slick = self.compound <= 2
+        
+        degradation_effect = 3.0 * self.degradation ** 2
+        
+        if env.is_wet:
+            weather_effect = np.where(is_slick, 10.0 + env.rain_intensity * 2, 0.0)
+        else:
+            weather_effect = np.where(is_slick, 0.0, 5.0)
+        
+        return BASE_PACE_FACTORS[self.compound] + degradation_effect + weather_effect
+
+
+def _plan_dry_stints(first_life, soft_life, medium_life, hard_life, total_laps):
+    """
+    Plan the pit stops of a dry race.
+    
+    Args:
+        first_life: Expected life of the starting tires (laps)
+        soft_life: Expected life of the soft compound (laps)
+        medium_life: Expected life of the medium compound (laps)
+        hard_life: Expected life of the hard compound (laps)
+        total_laps: Race distance in laps
+        
+    Returns:
+        int32 array of (lap, compound index) rows, one per pit stop
+    """
+    # Every stint covers at least the shortest tire life
+    max_stops = total_laps // min(first_life, soft_life) + 1
+    stops = np.empty((max_stops, 2), dtype=np.int32)
+    n_stops = 0
+    
+    laps_covered = first_life
+    while laps_covered < total_laps:
+        # Choose compound based on remaining laps
+        remaining_laps = total_laps - laps_covered
+        if remaining_laps < soft_life:
+            compound_id, life = 0, soft_life  # Fastest for the end
+        elif remaining_laps < medium_life:
+            compound_id, life = 1, medium_life
+        else:
+            compound_id, life = 2, hard_life
+        
+        stops[n_stops, 0] = laps_covered
+        stops[n_stops, 1] = compound_id
+        n_stops += 1
+        laps_covered += life
+    
+    return stops[:n_stops]
+
+
+if HAS_NUMBA:
+    _plan_dry_stints = njit(cache=True)(_plan_dry_stints)
+
+
+@lru_cache(maxsize=4096)
+def _optimal_strategy(tyre_wear, total_laps, condition, is_wet, heavy_rain, starting_compound):
+    """
+    Generate the pit stops for a race from the inputs the strategy depends on.
+    
+    Args:
+        tyre_wear: Track tyre wear rating
+        total_laps: Number of laps in the race
+        condition: Weather condition ('dry', 'wet', 'mixed')
+        is_wet: Whether conditions are wet
+        heavy_rain: Whether rain intensity is above 5
+        starting_compound: TireCompound fitted at the start
+        
+    Returns:
+        Tuple of (lap, compound) tuples indicating pit stops
+    """
+    # Expected tire life for each compound (laps)
+    tire_life = {
+        TireCompound.SOFT: max(15, 30 - tyre_wear),
+        TireCompound.MEDIUM: max(25, 45 - tyre_wear),
+        TireCompound.HARD: max(35, 60 - tyre_wear),
+        TireCompound.INTERMEDIATE: 40 if condition == 'mixed' else 20,
+        TireCompound.WET: 60 if condition == 'wet' else 10
+    }
+    
+    # Strategy depends on track length, tire wear and weather
+    pit_stops = []
+    
+    # Wet/intermediate conditions are special cases
+    if is_wet:
+        if condition == 'mixed':
+            # Mixed conditions - might need to switch between wet and dry tires
+            if heavy_rain:
+                # Start on wet, switch to inters if rain eases
+                pit_stops.append((int(total_laps * 0.4), TireCompound.INTERMEDIATE))
+            else:
+                # Start on inters, might need to switch later
+                pit_stops.append((int(total_laps * 0.5), TireCompound.SOFT))
+        else:  # fully wet
+            # May need one stop for fresh wet tires
+            if total_laps > tire_life[TireCompound.WET]:
+                pit_stops.append((tire_life[TireCompound.WET], TireCompound.WET))
+    else:
+        # Dry conditions - normal strategy
+        # Number of stops depends on track tire wear and race length
+        stops = _plan_dry_stints(
+            tire_life[starting_compound],
+            tire_life[TireCompound.SOFT],
+            tire_life[TireCompound.MEDIUM],
+            tire_life[TireCompound.HARD],
+            total_laps
+        )
+        pit_stops = [(int(lap), TireCompound(compound_id + 1)) for lap, compound_id in stops]
+    
+    return tuple(pit_stops)
+
+
+# Pit stop error descriptions by severity
+MINOR_PIT_ERRORS = (
+    "Slightly slow front tire change",
+    "Brief delay connecting wheel gun",
+    "Slight hesitation releasing the car"
+)
+MEDIUM_PIT_ERRORS = (
+    "Problem with wheel gun",
+    "Tire not ready immediately",
+    "Traffic in pit lane causing delay"
+)
+MAJOR_PIT_ERRORS = (
+    "Cross-threaded wheel nut",
+    "Car dropped before tire fitted",
+    "Fuel hose issue"
+)
+
+
 class PitStopStrategy:
     """Models a pit stop strategy for a race."""
     
+    __slots__ = ('track', 'weather', 'total_laps', 'pit_stops', 'starting_compound')
+    
     def __init__(self, track, weather, total_laps):
         """
         Initialize a pit stop strategy.
@@ -164,57 +423,18 @@ class PitStopStrategy:
         Returns:
             List of (lap, compound) tuples indicating pit stops
         """
-        # Expected tire life for each compound (laps)
-        tire_life = {
-            TireCompound.SOFT: max(15, 30 - self.track.tyre_wear),
-            TireCompound.MEDIUM: max(25, 45 - self.track.tyre_wear),
-            TireCompound.HARD: max(35, 60 - self.track.tyre_wear),
-            TireCompound.INTERMEDIATE: 40 if self.weather.condition == 'mixed' else 20,
-            TireCompound.WET: 60 if self.weather.condition == 'wet' else 10
-        }
+        weather = self.weather
+        pit_stops = _optimal_strategy(
+            self.track.tyre_wear,
+            self.total_laps,
+            weather.condition,
+            weather.is_wet,
+            weather.rain_intensity > 5,
+            self.starting_compound
+        )
         
-        # Strategy depends on track length, tire wear and weather
-        pit_stops = []
-        
-        # Wet/intermediate conditions are special cases
-        if self.weather.is_wet:
-            if self.weather.condition == 'mixed':
-                # Mixed conditions - might need to switch between wet and dry tires
-                if self.weather.rain_intensity > 5:
-                    # Start on wet, switch to inters if rain eases
-                    pit_stops.append((int(self.total_laps * 0.4), TireCompound.INTERMEDIATE))
-                else:
-                    # Start on inters, might need to switch later
-                    pit_stops.append((int(self.total_laps * 0.5), TireCompound.SOFT))
-            else:  # fully wet
-                # May need one stop for fresh wet tires
-                if self.total_laps > tire_life[TireCompound.WET]:
-                    pit_stops.append((tire_life[TireCompound.WET], TireCompound.WET))
-        else:
-            # Dry conditions - normal strategy
-            # Number of stops depends on track tire wear and race length
-            laps_covered = 0
-            current_compound = self.starting_compound
-            
-            while laps_covered < self.total_laps:
-                laps_covered += tire_life[current_compound]
-                
-                if laps_covered < self.total_laps:
-                    # Need another stop
-                    # Choose compound based on remaining laps
-                    remaining_laps = self.total_laps - laps_covered
-                    
-                    if remaining_laps < tire_life[TireCompound.SOFT]:
-                        next_compound = TireCompound.SOFT  # Fastest for the end
-                    elif remaining_laps < tire_life[TireCompound.MEDIUM]:
-                        next_compound = TireCompound.MEDIUM
-                    else:
-                        next_compound = TireCompound.HARD
-                    
-                    pit_stops.append((laps_covered, next_compound))
-                    current_compound = next_compound
-        
-        return pit_stops
+        # Copy so callers can't modify the cached strategy
+        return list(pit_stops)
     
     def execute_pit_stop(self, lap):
         """
@@ -243,25 +463,13 @@ class PitStopStrategy:
             
             if error_severity < 0.6:  # Minor issue
                 error_time = random.uniform(1, 3)
-                error_description = random.choice([
-                    "Slightly slow front tire change",
-                    "Brief delay connecting wheel gun",
-                    "Slight hesitation releasing the car"
-                ])
+                error_description = random.choice(MINOR_PIT_ERRORS)
             elif error_severity < 0.9:  # Medium issue
                 error_time = random.uniform(3, 8)
-                error_description = random.choice([
-                    "Problem with wheel gun",
-                    "Tire not ready immediately",
-                    "Traffic in pit lane causing delay"
-                ])
+                error_description = random.choice(MEDIUM_PIT_ERRORS)
             else:  # Major issue
                 error_time = random.uniform(8, 20)
-                error_description = random.choice([
-                    "Cross-threaded wheel nut",
-                    "Car dropped before tire fitted",
-                    "Fuel hose issue"
-                ])
+                error_description = random.choice(MAJOR_PIT_ERRORS)
         
         total_time_lost = base_time + execution_variation + error_time
         
@@ -331,4 +539,124 @@ def simulate_pit_stop(team_efficiency):
             "duration": stop_time,
             "error": None,
             "error_time": 0
-        }
\ No newline at end of file
+        }
+
+
+class PitStopSampler:
+    """
+    Batched source of pit stop randomness for Monte Carlo runs.
+    
+    Draws uniform samples in blocks from a NumPy Generator and hands them
+    out one stop at a time, instead of several `random` module calls per
+    stop. Draws are refilled automatically when a block runs out.
+    """
+    
+    def __init__(self, batch_size=4096, seed=None):
+        """
+        Initialize the sampler.
+        
+        Args:
+            batch_size: Number of pit stops drawn per block
+            seed: Optional seed for reproducible runs
+        """
+        self.rng = np.random.default_rng(seed)
+        self.batch_size = batch_size
+        self._refill()
+    
+    def _refill(self):
+        """Draw the next block of samples."""
+        n = self.batch_size
+        self._variation = self.rng.random(n)
+        self._error_roll = self.rng.random(n)
+        self._severity = self.rng.random(n)
+        self._error_fraction = self.rng.random(n)
+        self._description = self.rng.integers(0, 3, n)
+        self._next = 0
+    
+    def _take(self):
+        """Return the sample index for the next pit stop."""
+        if self._next >= self.batch_size:
+            self._refill()
+        i = self._next
+        self._next += 1
+        return i
+    
+    def execute_pit_stop(self, lap):
+        """
+        Batched equivalent of PitStopStrategy.execute_pit_stop.
+        
+        Args:
+            lap: Current lap number
+            
+        Returns:
+            Dictionary containing pit stop information including time lost
+        """
+        i = self._take()
+        
+        base_time = 22.0
+        execution_variation = self._variation[i] * 2 - 1  # ±1 second
+        
+        error_time = 0.0
+        error_description = None
+        
+        if self._error_roll[i] < 0.02:
+            severity = self._severity[i]
+            fraction = self._error_fraction[i]
+            
+            if severity < 0.6:  # Minor issue
+                error_time = 1 + fraction * 2
+                error_description = MINOR_PIT_ERRORS[self._description[i]]
+            elif severity < 0.9:  # Medium issue
+                error_time = 3 + fraction * 5
+                error_description = MEDIUM_PIT_ERRORS[self._description[i]]
+            else:  # Major issue
+                error_time = 8 + fraction * 12
+                error_description = MAJOR_PIT_ERRORS[self._description[i]]
+        
+        return {
+            "lap": lap,
+            "time_lost": float(base_time + execution_variation + error_time),
+            "error_time": float(error_time),
+            "error_description": error_description
+        }
+    
+    def simulate_pit_stop(self, team_efficiency):
+        """
+        Batched equivalent of simulate_pit_stop.
+        
+        Args:
+            team_efficiency: Rating of team's pit crew efficiency (1-100)
+        
+        Returns:
+            Dictionary with pit stop duration and any errors
+        """
+        i = self._take()
+        
+        base_time = 2.0
+        team_factor = 1 - (team_efficiency / 100) * 0.5
+        adjusted_base = base_time * (1 + team_factor)
+        random_variation = self._variation[i] - 0.3  # -0.3 to +0.7 seconds
+        
+        error = None
+        error_time = 0
+        
+        if self._error_roll[i] < 0.1 * (1 - team_efficiency / 100):
+            severity = self._severity[i]
+            fraction = self._error_fraction[i]
+            
+            if severity < 0.7:  # Minor issue
+                error_time = 1 + fraction * 2
+                error = "Minor delay"
+            elif severity < 0.95:  # Medium issue
+                error_time = 3 + fraction * 5
+                error = "Significant delay"
+            else:  # Major issue
+                error_time = 8 + fraction * 12
+                error = "Major pit stop problem"
+            error_time = float(error_time)
+        
+        return {
+            "duration": float(adjusted_base + random_variation + error_time),
+            "error": error,
+            "error_time": error_time
+        }
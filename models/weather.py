@@ -3,13 +3,52 @@ Module for simulating weather conditions for Formula 1 races.
 Weather has significant impact on race strategy and performance.
 """
 
-import random
+import datetime
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 
+import numpy as np
 
-@dataclass
+
+# Month name -> month number for parsing track dates
+_MONTHS = {
+    'January': 1, 'February': 2, 'March': 3, 'April': 4,
+    'May': 5, 'June': 6, 'July': 7, 'August': 8,
+    'September': 9, 'October': 10, 'November': 11, 'December': 12
+}
+
+# Matches the month in dates like "April 4-6, 2025"
+_MONTH_RE = re.compile(r'(\w+)\s+\d+')
+
+# Weather conditions, in the order used for condition codes in batches
+WEATHER_CONDITIONS = ('dry', 'wet', 'mixed')
+
+# Temperature adjustment by month
+_SEASON_ADJ = {
+    1: -5, 2: -4, 3: -2, 4: 0,     # Winter/Spring
+    5: 3, 6: 5, 7: 7, 8: 7,        # Summer
+    9: 4, 10: 0, 11: -3, 12: -5    # Autumn/Winter
+}
+
+# (low, high) uniform ranges for each weather parameter, one row per condition
+_PARAMETER_RANGES = {
+    'humidity': ((40, 70), (70, 95), (60, 85)),
+    'wind_speed': ((0, 25), (5, 40), (3, 35)),
+    'rain_chance': ((0, 15), (70, 100), (40, 80)),
+    'rain_intensity': ((0, 0), (3, 10), (1, 6)),
+    'track_offset': ((10, 20), (0, 7), (5, 15))  # Track temperature above air
+}
+
+
+@dataclass(frozen=True)
 class WeatherCondition:
     """Represents weather conditions during a race."""
+    # Declared by hand (rather than slots=True) to stay compatible with Python 3.8
+    __slots__ = ('condition', 'temperature', 'humidity', 'wind_speed', 'rain_chance',
+                 'rain_intensity', 'track_temperature', '_is_wet', '_weather_factor')
+    
     condition: str  # 'dry', 'wet', 'mixed'
     temperature: float  # in Celsius
     humidity: float  # percentage
@@ -18,19 +57,38 @@ class WeatherCondition:
     rain_intensity: float  # 0-10 scale, 0 is no rain, 10 is monsoon
     track_temperature: float  # in Celsius
     
+    def __post_init__(self):
+        # Conditions don't change once generated, so derive the factors once
+        object.__setattr__(self, '_is_wet', self._compute_is_wet())
+        object.__setattr__(self, '_weather_factor', self._compute_factor())
+    
+    def __getstate__(self):
+        # Frozen slotted instances need explicit state handling to copy/pickle
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
     def __str__(self):
         return f"{self.condition.title()} - {self.temperature}°C, Rain: {int(self.rain_chance)}%"
     
     @property
     def is_wet(self):
         """Check if conditions are wet."""
-        return self.condition == 'wet' or (self.condition == 'mixed' and self.rain_intensity > 3)
+        return self._is_wet
 
     @property
     def weather_factor(self):
         """Calculate impact of weather on race conditions.
         Returns a value between 0-1, where 0 is extreme weather impact, 1 is ideal conditions.
         """
+        return self._weather_factor
+    
+    def _compute_is_wet(self):
+        return self.condition == 'wet' or (self.condition == 'mixed' and self.rain_intensity > 3)
+    
+    def _compute_factor(self):
         if self.condition == 'dry':
             # Perfect conditions
             if 18 <= self.temperature <= 26 and self.wind_speed < 20:
@@ -61,6 +119,67 @@ class WeatherCondition:
             return base - rain_factor
 
 
+@lru_cache(maxsize=256)
+def _parse_month(date_str):
+    """Parse the month number from a track date, or None if it can't be parsed."""
+    # Handle date format like "April 4-6, 2025"
+    month_match = _MONTH_RE.match(date_str)
+    if month_match:
+        return _MONTHS.get(month_match.group(1))
+    return None
+
+
+def _month_of(date_str):
+    """Get the month number of a track date, falling back to the current month."""
+    month = _parse_month(date_str)
+    if month is None:
+        month = datetime.datetime.now().month
+    return month
+
+
+def _condition_probabilities(country, month):
+    """Get the (dry, wet, mixed) probabilities for a country and month."""
+    # Default probabilities
+    dry_prob = 0.7
+    wet_prob = 0.2
+    mixed_prob = 0.1
+    
+    # Adjust for certain tracks/seasons known for rain
+    if country.lower() in ["malaysia", "japan", "brazil", "belgium", "great britain", "singapore"]:
+        dry_prob -= 0.2
+        wet_prob += 0.1
+        mixed_prob += 0.1
+        
+    # Adjust for season (more rain in certain months)
+    if month in [3, 4, 10, 11]:  # Spring and autumn months
+        dry_prob -= 0.1
+        wet_prob += 0.05
+        mixed_prob += 0.05
+    
+    return dry_prob, wet_prob, mixed_prob
+
+
+@lru_cache(maxsize=None)
+def _condition_cum_weights(country, month):
+    """Get the cumulative (dry, wet, mixed) weights for a country and month."""
+    return tuple(accumulate(_condition_probabilities(country, month)))
+
+
+def _base_temperature(country, month):
+    """Get the expected air temperature for a country and month."""
+    # Base temperature on month and location
+    base_temp = 22  # Default base temperature
+    
+    # Adjust for location (rough approximations)
+    location_adj = 0
+    if country.lower() in ["bahrain", "saudi arabia", "qatar", "uae", "singapore"]:
+        location_adj = 8  # Hot locations
+    elif country.lower() in ["canada", "japan", "great britain", "belgium"]:
+        location_adj = -3  # Cooler locations
+    
+    return base_temp + _SEASON_ADJ[month] + location_adj
+
+
 def generate_weather(track, month=None, forced_condition=None):
     """Generate realistic weather conditions for a given track.
     
@@ -72,100 +191,65 @@ def generate_weather(track, month=None, forced_condition=None):
     Returns:
         WeatherCondition object
     """
-    if month is None:
-        # Extract month from track date
-        import datetime
-        import re
+    # A single row of the batch sampler, so both draw from the same distributions
+    return weather_from_batch(generate_weather_batch(track, 1, month, forced_condition), 0)
+
+
+def generate_weather_batch(track, n, month=None, forced_condition=None, seed=None):
+    """Generate many weather samples for a track at once.
+    
+    Draws follow the same distributions as generate_weather(), but every
+    parameter is sampled for all n rows with a single NumPy call.
+    
+    Args:
+        track: Track object
+        n: Number of samples
+        month: Optional month to override track date
+        forced_condition: Optional weather condition to force ('dry', 'wet', 'mixed')
+        seed: Optional seed for the random generator
         
-        # Handle date format like "April 4-6, 2025"
-        # Extract just the month name using regex
-        month_match = re.match(r'(\w+)\s+\d+', track.date)
-        if month_match:
-            month_name = month_match.group(1)
-            # Convert month name to month number
-            month_dict = {
-                'January': 1, 'February': 2, 'March': 3, 'April': 4,
-                'May': 5, 'June': 6, 'July': 7, 'August': 8,
-                'September': 9, 'October': 10, 'November': 11, 'December': 12
-            }
-            month = month_dict.get(month_name, datetime.datetime.now().month)
-        else:
-            # Fallback to current month if parsing fails
-            month = datetime.datetime.now().month
-    
-    # Weather probabilities based on location and month
+    Returns:
+        Dictionary of arrays of length n. 'condition' holds indices into
+        WEATHER_CONDITIONS; the other keys match WeatherCondition fields.
+    """
+    if month is None:
+        month = _month_of(track.date)
+    
+    rng = np.random.default_rng(seed)
+    
     if forced_condition:
-        condition = forced_condition
+        condition = np.full(n, WEATHER_CONDITIONS.index(forced_condition), dtype=np.int8)
     else:
-        # Default probabilities
-        dry_prob = 0.7
-        wet_prob = 0.2
-        mixed_prob = 0.1
-        
-        # Adjust for certain tracks/seasons known for rain
-        if track.country.lower() in ["malaysia", "japan", "brazil", "belgium", "great britain", "singapore"]:
-            dry_prob -= 0.2
-            wet_prob += 0.1
-            mixed_prob += 0.1
-            
-        # Adjust for season (more rain in certain months)
-        if month in [3, 4, 10, 11]:  # Spring and autumn months
-            dry_prob -= 0.1
-            wet_prob += 0.05
-            mixed_prob += 0.05
-            
-        # Choose condition based on probabilities
-        conditions = ['dry', 'wet', 'mixed']
-        probabilities = [dry_prob, wet_prob, mixed_prob]
-        condition = random.choices(conditions, weights=probabilities, k=1)[0]
+        cum_weights = np.array(_condition_cum_weights(track.country, month))
+        condition = np.searchsorted(cum_weights, rng.random(n) * cum_weights[-1], side='right')
+        condition = np.minimum(condition, len(WEATHER_CONDITIONS) - 1).astype(np.int8)
     
-    # Base temperature on month and location
-    base_temp = 22  # Default base temperature
+    def sample(parameter):
+        ranges = np.asarray(_PARAMETER_RANGES[parameter], dtype=np.float64)[condition]
+        return ranges[:, 0] + (ranges[:, 1] - ranges[:, 0]) * rng.random(n)
     
-    # Adjust for season
-    season_adj = {
-        1: -5, 2: -4, 3: -2, 4: 0,     # Winter/Spring
-        5: 3, 6: 5, 7: 7, 8: 7,        # Summer
-        9: 4, 10: 0, 11: -3, 12: -5    # Autumn/Winter
-    }
+    temp_base = _base_temperature(track.country, month)
+    temperature = np.round(temp_base + rng.uniform(-3, 3, n), 1)
     
-    # Adjust for location (rough approximations)
-    location_adj = 0
-    if track.country.lower() in ["bahrain", "saudi arabia", "qatar", "uae", "singapore"]:
-        location_adj = 8  # Hot locations
-    elif track.country.lower() in ["canada", "japan", "great britain", "belgium"]:
-        location_adj = -3  # Cooler locations
-        
-    # Calculate temperature with some randomness
-    temp_base = base_temp + season_adj[month] + location_adj
-    temperature = round(temp_base + random.uniform(-3, 3), 1)
-    
-    # Generate other weather parameters
-    if condition == 'dry':
-        humidity = random.uniform(40, 70)
-        wind_speed = random.uniform(0, 25)
-        rain_chance = random.uniform(0, 15)
-        rain_intensity = 0
-        track_temp = temperature + random.uniform(10, 20)
-    elif condition == 'wet':
-        humidity = random.uniform(70, 95)
-        wind_speed = random.uniform(5, 40)
-        rain_chance = random.uniform(70, 100)
-        rain_intensity = random.uniform(3, 10)
-        track_temp = temperature + random.uniform(0, 7)
-    else:  # mixed
-        humidity = random.uniform(60, 85)
-        wind_speed = random.uniform(3, 35)
-        rain_chance = random.uniform(40, 80)
-        rain_intensity = random.uniform(1, 6)
-        track_temp = temperature + random.uniform(5, 15)
-        
+    return {
+        'condition': condition,
+        'temperature': temperature,
+        'humidity': np.round(sample('humidity'), 1),
+        'wind_speed': np.round(sample('wind_speed'), 1),
+        'rain_chance': np.round(sample('rain_chance'), 1),
+        'rain_intensity': np.round(sample('rain_intensity'), 1),
+        'track_temperature': np.round(temperature + sample('track_offset'), 1)
+    }
+
+
+def weather_from_batch(batch, index):
+    """Build the WeatherCondition for one row of a generate_weather_batch() result."""
     return WeatherCondition(
-        condition=condition,
-        temperature=round(temperature, 1),
-        humidity=round(humidity, 1),
-        wind_speed=round(wind_speed, 1),
-        rain_chance=round(rain_chance, 1),
-        rain_intensity=round(rain_intensity, 1),
-        track_temperature=round(track_temp, 1)
-    )
\ No newline at end of file
+        condition=WEATHER_CONDITIONS[batch['condition'][index]],
+        temperature=float(batch['temperature'][index]),
+        humidity=float(batch['humidity'][index]),
+        wind_speed=float(batch['wind_speed'][index]),
+        rain_chance=float(batch['rain_chance'][index]),
+        rain_intensity=float(batch['rain_intensity'][index]),
+        track_temperature=float(batch['track_temperature'][index])
+    )
@@ -0,0 +1,161 @@
+"""
+Numerical kernels for the simulated lap time and tire performance charts.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the NumPy code paths are used without it
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+def _lap_times_numpy(base_time, pit_laps, variation, laps):
+    """NumPy version of compute_lap_times, used without Numba."""
+    lap_numbers = np.arange(1, laps + 1)
+    
+    # Effect of fuel load (decreases over time, making car faster)
+    fuel_effect = 0.2 * (1 - np.minimum(lap_numbers / laps, 1))
+    
+    # One search against the sorted stops, padded with the race start, gives
+    # each lap's last stop before it (or 0)
+    stops = np.concatenate(([0], pit_laps))
+    last_pit = stops[np.searchsorted(stops, lap_numbers) - 1]
+    laps_since_pit = lap_numbers - last_pit
+    
+    # Pit laps as a mask over laps 0..laps, for the pit stop penalty
+    pit_mask = np.zeros(laps + 1, dtype=bool)
+    pit_mask[pit_laps] = True
+    
+    # New tires take a few laps to warm up, then performance degrades
+    tire_effect = np.where(laps_since_pit <= 3,
+                           0.3 * (1 - laps_since_pit / 3),
+                           0.01 * np.maximum(laps_since_pit - 3, 0) ** 1.5)
+    
+    times = base_time + fuel_effect + tire_effect + variation
+    times += 20 * pit_mask[1:]
+    return times
+
+
+def _tire_curve_numpy(stop_laps, deg_factors, noise):
+    """NumPy version of compute_tire_curve, used without Numba."""
+    x_parts = [np.zeros(1)]
+    y_parts = [np.full(1, 100.0)]
+    
+    for j in range(len(stop_laps) - 1):
+        start_lap = stop_laps[j]
+        end_lap = stop_laps[j + 1]
+        stint_laps = np.arange(1, end_lap - start_lap + 1)
+        
+        # Performance drop accelerates slightly as tires age
+        age_factor = (stint_laps / 10) ** 1.2
+        x_parts.append(start_lap + stint_laps)
+        y_parts.append(100 - (deg_factors[j] * age_factor * stint_laps + noise[start_lap:end_lap]))
+        
+        # After pit stop, performance resets to ~100%
+        if j < len(stop_laps) - 2:
+            x_parts.append(np.full(1, end_lap))
+            y_parts.append(np.full(1, 100.0))
+    
+    return np.concatenate(x_parts), np.concatenate(y_parts)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _lap_times_jit(base_time, pit_laps, variation, laps):
+        """Lap-by-lap loop version of compute_lap_times."""
+        times = np.empty(laps)
+        next_stop = 0
+        last_pit = 0
+        
+        for lap in range(1, laps + 1):
+            fuel_effect = 0.2 * (1 - min(lap / laps, 1.0))
+            
+            # Pit laps are sorted, so the last stop only ever moves forward
+            while next_stop < pit_laps.shape[0] and pit_laps[next_stop] < lap:
+                last_pit = pit_laps[next_stop]
+                next_stop += 1
+            laps_since_pit = lap - last_pit
+            
+            if laps_since_pit <= 3:
+                tire_effect = 0.3 * (1 - laps_since_pit / 3)
+            else:
+                tire_effect = 0.01 * (laps_since_pit - 3) ** 1.5
+            
+            lap_time = base_time + fuel_effect + tire_effect + variation[lap - 1]
+            if next_stop < pit_laps.shape[0] and pit_laps[next_stop] == lap:
+                lap_time += 20
+            times[lap - 1] = lap_time
+        
+        return times
+    
+    @njit(cache=True, fastmath=True)
+    def _tire_curve_jit(stop_laps, deg_factors, noise):
+        """Lap-by-lap loop version of compute_tire_curve."""
+        n_stints = stop_laps.shape[0] - 1
+        size = 1 + (stop_laps[-1] - stop_laps[0]) + (n_stints - 1)
+        x_values = np.empty(size)
+        y_values = np.empty(size)
+        x_values[0] = 0.0
+        y_values[0] = 100.0
+        k = 1
+        
+        for j in range(n_stints):
+            start_lap = stop_laps[j]
+            end_lap = stop_laps[j + 1]
+            for lap in range(start_lap + 1, end_lap + 1):
+                stint_lap = lap - start_lap
+                age_factor = (stint_lap / 10) ** 1.2
+                x_values[k] = lap
+                y_values[k] = 100 - (deg_factors[j] * age_factor * stint_lap + noise[lap - 1])
+                k += 1
+            
+            if j < n_stints - 1:
+                x_values[k] = end_lap
+                y_values[k] = 100.0
+                k += 1
+        
+        return x_values, y_values
+
+
+def compute_lap_times(base_time, pit_laps, variation, laps):
+    """
+    Compute a driver's simulated lap times over the race.
+    
+    Args:
+        base_time: Driver's base lap time in seconds
+        pit_laps: Laps on which the driver pits, between 1 and laps
+        variation: Per-lap random variation in seconds, one value per lap
+        laps: Number of laps in the race
+    
+    Returns:
+        float64 array of lap times, one per lap
+    """
+    pit_laps = np.sort(np.asarray(pit_laps, dtype=np.int64))
+    variation = np.asarray(variation, dtype=np.float64)
+    if HAS_NUMBA:
+        return _lap_times_jit(float(base_time), pit_laps, variation, int(laps))
+    return _lap_times_numpy(base_time, pit_laps, variation, laps)
+
+
+def compute_tire_curve(stop_laps, deg_factors, noise):
+    """
+    Compute a driver's tire performance curve over the race.
+    
+    Args:
+        stop_laps: Stint boundaries, starting with 0 and ending with the race distance
+        deg_factors: Degradation factor of each stint's compound
+        noise: Per-lap random variation in performance, one value per lap
+    
+    Returns:
+        Tuple of (x_values, y_values) float64 arrays. Performance resets to
+        100% at each pit stop
+    """
+    stop_laps = np.asarray(stop_laps, dtype=np.int64)
+    deg_factors = np.asarray(deg_factors, dtype=np.float64)
+    noise = np.asarray(noise, dtype=np.float64)
+    if HAS_NUMBA:
+        return _tire_curve_jit(stop_laps, deg_factors, noise)
+    return _tire_curve_numpy(stop_laps, deg_factors, noise)
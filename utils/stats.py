@@ -4,80 +4,99 @@ Statistics and analysis utilities for F1 race simulation.
 
 import numpy as np
 import pandas as pd
+from collections import Counter
 from dataclasses import dataclass
 from typing import List, Dict
 
 
 @dataclass
 class SeasonStats:
-    """Track driver and team statistics across a season."""
-    driver_points: Dict  # Driver name -> points
-    team_points: Dict    # Team name -> points
-    race_wins: Dict      # Driver name -> number of wins
-    podiums: Dict        # Driver name -> number of podiums
-    fastest_laps: Dict   # Driver name -> number of fastest laps
-    pole_positions: Dict # Driver name -> number of poles
+    """Track driver and team statistics across a season.
+    
+    The stats accept any name -> count mapping and are stored as Counters.
+    """
+    driver_points: Counter  # Driver name -> points
+    team_points: Counter    # Team name -> points
+    race_wins: Counter      # Driver name -> number of wins
+    podiums: Counter        # Driver name -> number of podiums
+    fastest_laps: Counter   # Driver name -> number of fastest laps
+    pole_positions: Counter # Driver name -> number of poles
+    
+    def __post_init__(self):
+        """Store every stat as a Counter, so missing names count as zero."""
+        for name in ('driver_points', 'team_points', 'race_wins', 'podiums',
+                     'fastest_laps', 'pole_positions'):
+            stats = getattr(self, name)
+            if not isinstance(stats, Counter):
+                setattr(self, name, Counter(stats))
     
     @classmethod
     def new_season(cls):
         """Create a new empty season statistics object."""
         return cls(
-            driver_points={},
-            team_points={},
-            race_wins={},
-            podiums={},
-            fastest_laps={},
-            pole_positions={}
+            driver_points=Counter(),
+            team_points=Counter(),
+            race_wins=Counter(),
+            podiums=Counter(),
+            fastest_laps=Counter(),
+            pole_positions=Counter()
         )
     
     def update_with_race_results(self, results, grid_positions):
         """Update season statistics with results from a race."""
         # Update pole positions
         if grid_positions:
-            pole_driver = grid_positions[0].name
-            self.pole_positions[pole_driver] = self.pole_positions.get(pole_driver, 0) + 1
+            self.pole_positions[grid_positions[0].name] += 1
         
-        # Update other stats
+        # Update points
         for result in results:
-            driver_name = result.driver.name
-            team_name = result.team.name
-            
-            # Update points
-            self.driver_points[driver_name] = self.driver_points.get(driver_name, 0) + result.points
-            self.team_points[team_name] = self.team_points.get(team_name, 0) + result.points
-            
-            # Race winner
-            if result.finishing_position == 1:
-                self.race_wins[driver_name] = self.race_wins.get(driver_name, 0) + 1
-            
-            # Podium finishers
-            if result.finishing_position <= 3:
-                self.podiums[driver_name] = self.podiums.get(driver_name, 0) + 1
-            
-            # Fastest lap
-            if result.fastest_lap:
-                self.fastest_laps[driver_name] = self.fastest_laps.get(driver_name, 0) + 1
+            self.driver_points[result.driver.name] += result.points
+            self.team_points[result.team.name] += result.points
+        
+        # Race winner, podium finishers and fastest lap
+        self.race_wins.update(r.driver.name for r in results if r.finishing_position == 1)
+        self.podiums.update(r.driver.name for r in results if r.finishing_position <= 3)
+        self.fastest_laps.update(r.driver.name for r in results if r.fastest_lap)
+    
+    def _driver_arrays(self):
+        """Build per-driver stat columns in driver_points order."""
+        names = list(self.driver_points)
+        
+        # np.array keeps integer tallies as int64 and switches to float64
+        # when any value (e.g. half points) is fractional
+        def column(stats):
+            return np.array([stats.get(name, 0) for name in names])
+        
+        return {
+            'Driver': np.array(names, dtype=object),
+            'Points': column(self.driver_points),
+            'Wins': column(self.race_wins),
+            'Podiums': column(self.podiums),
+            'Fastest Laps': column(self.fastest_laps),
+            'Poles': column(self.pole_positions)
+        }
+    
+    def driver_standings_arrays(self):
+        """
+        Get the current driver standings as sorted NumPy columns.
+        
+        Returns:
+            Tuple of (order, columns) where order holds the original row
+            index of each standings position and columns maps column names
+            to arrays sorted by points, then wins (both descending)
+        """
+        arrays = self._driver_arrays()
+        order = np.lexsort((-arrays['Wins'], -arrays['Points']))
+        return order, {name: values[order] for name, values in arrays.items()}
     
     def driver_standings(self):
         """Get the current driver standings."""
-        # Convert to pandas DataFrame for easy sorting
-        drivers = []
-        for driver, points in self.driver_points.items():
-            drivers.append({
-                'Driver': driver,
-                'Points': points,
-                'Wins': self.race_wins.get(driver, 0),
-                'Podiums': self.podiums.get(driver, 0),
-                'Fastest Laps': self.fastest_laps.get(driver, 0),
-                'Poles': self.pole_positions.get(driver, 0)
-            })
-        
-        df = pd.DataFrame(drivers)
-        if len(df) > 0:
-            # Sort by points (descending) then by wins
-            df = df.sort_values(['Points', 'Wins'], ascending=[False, False])
+        if not self.driver_points:
+            return pd.DataFrame()
         
-        return df
+        # Sort by points (descending) then by wins
+        order, columns = self.driver_standings_arrays()
+        return pd.DataFrame(columns, index=order)
     
     def team_standings(self):
         """Get the current constructor standings."""
@@ -107,28 +126,38 @@ def analyze_qualifying_performance(qualifying_results, race_results):
     Returns:
         DataFrame with analysis metrics
     """
-    analysis = []
+    results_by_driver = {r.driver: r for r in race_results}
+    
+    # Preallocate columns for the whole grid, trimmed to the matched rows
+    n = len(qualifying_results)
+    names = np.empty(n, dtype=object)
+    quali_pos = np.empty(n, dtype=np.int16)
+    race_pos = np.empty(n, dtype=np.int16)
+    status = np.empty(n, dtype=object)
+    count = 0
     
     for i, driver in enumerate(qualifying_results):
-        quali_pos = i + 1
-        
         # Find corresponding race result
-        race_result = next((r for r in race_results if r.driver == driver), None)
+        race_result = results_by_driver.get(driver)
         
         if race_result:
-            race_pos = race_result.finishing_position
-            pos_change = quali_pos - race_pos
-            status = race_result.status
-            
-            analysis.append({
-                'Driver': driver.name,
-                'Qualifying': quali_pos,
-                'Race': race_pos,
-                'Change': pos_change,
-                'Status': status
-            })
+            names[count] = driver.name
+            quali_pos[count] = i + 1
+            race_pos[count] = race_result.finishing_position
+            status[count] = race_result.status
+            count += 1
     
-    return pd.DataFrame(analysis)
+    if count == 0:
+        return pd.DataFrame()
+    
+    quali_pos, race_pos = quali_pos[:count], race_pos[:count]
+    return pd.DataFrame({
+        'Driver': names[:count],
+        'Qualifying': quali_pos,
+        'Race': race_pos,
+        'Change': quali_pos - race_pos,
+        'Status': status[:count]
+    }, copy=False)
 
 
 def calculate_performance_metrics(results):
@@ -141,16 +170,20 @@ def calculate_performance_metrics(results):
     Returns:
         Dictionary with various performance metrics
     """
+    statuses = np.array([r.status for r in results], dtype=str)
+    times = np.fromiter((r.time for r in results), dtype=np.float64, count=len(results))
+    
     # Count finished drivers
-    finished = sum(1 for r in results if r.status == 'Finished')
-    dnf = sum(1 for r in results if r.status == 'DNF')
-    dsq = sum(1 for r in results if r.status == 'DSQ')
+    finished_mask = statuses == 'Finished'
+    finished = int(finished_mask.sum())
+    dnf = int((statuses == 'DNF').sum())
+    dsq = int((statuses == 'DSQ').sum())
     
     # Calculate average time gap between positions
-    times = [r.time for r in results if r.status == 'Finished']
-    if len(times) > 1:
-        winner_time = times[0]
-        avg_gap = np.mean([(t - winner_time) / winner_time * 100 for t in times[1:]])
+    finished_times = times[finished_mask]
+    if finished_times.size > 1:
+        winner_time = finished_times[0]
+        avg_gap = float(((finished_times[1:] - winner_time) / winner_time * 100).mean())
     else:
         avg_gap = 0
     
@@ -182,8 +215,9 @@ def driver_comparison(driver_name1, driver_name2, races):
         results = race['results']
         
         # Find both drivers' results
-        result1 = next((r for r in results if r.driver.name == driver_name1), None)
-        result2 = next((r for r in results if r.driver.name == driver_name2), None)
+        results_by_name = {r.driver.name: r for r in results}
+        result1 = results_by_name.get(driver_name1)
+        result2 = results_by_name.get(driver_name2)
         
         if result1 and result2:
             # Both drivers have results for this race
@@ -1,34 +1,128 @@
 """
 Visualization utilities for F1 race simulation.
+
+Plots are only ever saved to PNG files, so matplotlib is pinned to the
+non-interactive Agg backend; plt.show() is not supported.
 """
 
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 from tabulate import tabulate as tabulate_func
 import time
 import sys
 from colorama import init, Fore, Style
-import random
+import re
 import os
-# Initialize colorama for cross-platform colored terminal output
-init()
+# Initialize colorama for cross-platform colored terminal output. Each write
+# is reset automatically, so only colors embedded mid-line need Style.RESET_ALL
+init(autoreset=True)
+
+# Merge nearly co-linear line segments before rasterizing
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+
+# Color codes bound once, used throughout the display code
+_FG = Fore.GREEN
+_FR = Fore.RED
+_FM = Fore.MAGENTA
+_FC = Fore.CYAN
+_FY = Fore.YELLOW
+_FB = Fore.BLUE
+_RST = Style.RESET_ALL
+
+# Position change indicators for table cells
+GREEN_UP = _FG + "↑"
+RED_DOWN = _FR + "↓"
+
+# Cell templates for the results tables, filled with str.format
+_POS_UP = GREEN_UP + "{}" + _RST
+_POS_DOWN = RED_DOWN + "{}" + _RST
+_FL_TAG = "{} " + _FM + "FL" + _RST
+_STATUS_OUT = _FR + "{}" + _RST
+
+# Results table columns. Alignment is given explicitly so tabulate doesn't
+# have to parse every cell to detect numeric columns
+QUALIFYING_HEADERS = ("Pos", "Driver", "Team", "No.")
+QUALIFYING_COLALIGN = ("right", "left", "left", "right")
+RESULTS_HEADERS = ("Pos", "Driver", "Team", "Start", "Change", "Time/Status", "Pts")
+RESULTS_COLALIGN = ("right", "left", "left", "right", "left", "left", "right")
+
+# Live race table columns, formatted without tabulate since the layout is fixed
+LIVE_HEADERS = ("Pos", "Δ", "Driver", "Team", "Sectors | Lap Time", "Gap")
+LIVE_ALIGNS = (">", "<", "<", "<", "<", "<")
+
+# Live race commentary templates
+RACE_HIGHLIGHTS = (
+    _FY + "Good defending from {driver} against {rival}!",
+    _FC + "DRS enabled for {driver} - closing in!",
+    _FG + "Great overtake at Turn {turn}!",
+    _FR + "Lock-up for {driver} at Turn {turn}",
+    _FY + "Yellow flags in sector {sector} - incident being investigated"
+)
+PIT_WINDOW_HIGHLIGHT = _FC + "Pit window is now open - expecting stops soon"
+TIRE_WEAR_HIGHLIGHT = _FC + "Teams reporting tire degradation becoming significant"
+
+# Matches ANSI color escape sequences, which take no space on screen
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# Team colors for drivers (approximated)
+TEAM_COLORS = {
+    'Red Bull Racing': '#0600EF',  # Dark blue
+    'Ferrari': '#DC0000',          # Red
+    'Mercedes': '#00D2BE',         # Teal
+    'McLaren': '#FF8700',          # Orange
+    'Aston Martin': '#006F62',     # Green
+    'Alpine': '#0090FF',           # Blue
+    'Williams': '#005AFF',         # Blue
+    'Racing Bulls': '#052C5A',     # Navy
+    'Kick Sauber': '#52E252',      # Green
+    'Haas': '#FFFFFF'              # White
+}
+
+# Shared random generator for the simulated race data
+_RNG = np.random.default_rng()
+
+# Box style shared by the race phase annotations
+_ANNOT_BBOX = dict(boxstyle='round', facecolor='white', alpha=0.7)
+
+
+def _pipe_row(cells, widths, aligns):
+    """Format one row of a pipe table, padding cells by their visible width."""
+    padded = []
+    for cell, width, align in zip(cells, widths, aligns):
+        fill = " " * (width - len(_ANSI_RE.sub("", cell)))
+        padded.append(fill + cell if align == ">" else cell + fill)
+    return "| " + " | ".join(padded) + " |"
+
+
+def _pipe_separator(widths, aligns):
+    """Format the header separator line of a pipe table."""
+    return "|" + "|".join(
+        "-" * (width + 1) + ":" if align == ">" else ":" + "-" * (width + 1)
+        for width, align in zip(widths, aligns)
+    ) + "|"
+
 
 def display_race_header(track, weather):
     """Display a styled header for race information."""
-    print("\n" + "=" * 80)
-    print(f"{Fore.CYAN}2025 FORMULA 1 GRAND PRIX - {track.name.upper()}{Style.RESET_ALL}")
-    print(f"Location: {track.city}, {track.country}")
-    print(f"Track Length: {track.length_km}km - {track.laps} laps ({int(track.length_km * track.laps)}km)")
-    print(f"Weather: {weather}")
+    lines = [
+        "\n" + "=" * 80,
+        f"{_FC}2025 FORMULA 1 GRAND PRIX - {track.name.upper()}{_RST}",
+        f"Location: {track.city}, {track.country}",
+        f"Track Length: {track.length_km}km - {track.laps} laps ({int(track.length_km * track.laps)}km)",
+        f"Weather: {weather}"
+    ]
     if weather.is_wet:
-        print(f"{Fore.BLUE}Wet conditions - Rain intensity: {weather.rain_intensity:.1f}/10{Style.RESET_ALL}")
-    print("=" * 80 + "\n")
+        lines.append(f"{_FB}Wet conditions - Rain intensity: {weather.rain_intensity:.1f}/10{_RST}")
+    lines.append("=" * 80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def display_qualifying_results(qualifying_results):
     """Display the qualifying results in a formatted table."""
-    print(f"\n{Fore.YELLOW}QUALIFYING RESULTS{Style.RESET_ALL}")
-    print("-" * 60)
-    
     table_data = []
     for i, driver in enumerate(qualifying_results, 1):
         table_data.append([
@@ -38,33 +132,28 @@ def display_qualifying_results(qualifying_results):
             f"{driver.number}"
         ])
     
-    headers = ["Pos", "Driver", "Team", "No."]
-    print(tabulate_func(table_data, headers=headers, tablefmt="pipe"))
-    print("")
+    table = tabulate_func(table_data, headers=QUALIFYING_HEADERS, tablefmt="pipe",
+                          colalign=QUALIFYING_COLALIGN, disable_numparse=True)
+    sys.stdout.write(f"\n{_FY}QUALIFYING RESULTS{_RST}\n" + "-" * 60 + "\n" + table + "\n\n")
 
 def display_race_results(results):
     """Display the race results in a formatted table."""
-    print(f"\n{Fore.GREEN}RACE RESULTS{Style.RESET_ALL}")
-    print("-" * 80)
-    
     table_data = []
-    for result in results:
+    formatted_times = format_race_times([r.time for r in results])
+    for result, race_time in zip(results, formatted_times):
         pos_change = result.starting_position - result.finishing_position
         if pos_change > 0:
-            pos_indicator = f"{Fore.GREEN}↑{pos_change}{Style.RESET_ALL}"
+            pos_indicator = _POS_UP.format(pos_change)
         elif pos_change < 0:
-            pos_indicator = f"{Fore.RED}↓{abs(pos_change)}{Style.RESET_ALL}"
+            pos_indicator = _POS_DOWN.format(-pos_change)
         else:
             pos_indicator = "→"
             
         status = result.status
         if status == "Finished":
-            if result.fastest_lap:
-                time_display = f"{format_race_time(result.time)} {Fore.MAGENTA}FL{Style.RESET_ALL}"
-            else:
-                time_display = format_race_time(result.time)
+            time_display = _FL_TAG.format(race_time) if result.fastest_lap else race_time
         else:
-            time_display = f"{Fore.RED}{status}{Style.RESET_ALL}"
+            time_display = _STATUS_OUT.format(status)
             
         table_data.append([
             f"{result.finishing_position:2d}",
@@ -76,38 +165,56 @@ def display_race_results(results):
             f"{result.points}" if result.points > 0 else ""
         ])
     
-    headers = ["Pos", "Driver", "Team", "Start", "Change", "Time/Status", "Pts"]
-    print(tabulate_func(table_data, headers=headers, tablefmt="pipe"))
+    lines = [
+        f"\n{_FG}RACE RESULTS{_RST}",
+        "-" * 80,
+        tabulate_func(table_data, headers=RESULTS_HEADERS, tablefmt="pipe",
+                      colalign=RESULTS_COLALIGN, disable_numparse=True)
+    ]
     
     # Display incidents
     incidents = [r for r in results if r.incident_description]
     if incidents:
-        print(f"\n{Fore.YELLOW}RACE INCIDENTS:{Style.RESET_ALL}")
-        for incident in incidents:
-            print(f"  • Lap {incident.incident_description}")
+        lines.append(f"\n{_FY}RACE INCIDENTS:{_RST}")
+        lines.extend(f"  • Lap {incident.incident_description}" for incident in incidents)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def format_race_times(seconds):
+    """Format an array of race times in minutes:seconds.milliseconds format."""
+    seconds = np.asarray(seconds, dtype=float)
+    minutes = (seconds // 60).astype(int)
+    remaining_seconds = (seconds % 60).astype(int)
+    milliseconds = ((seconds - seconds.astype(int)) * 1000).astype(int)
+    return [f"{m:02d}:{s:02d}.{ms:03d}" for m, s, ms in zip(minutes, remaining_seconds, milliseconds)]
 
 def format_race_time(seconds):
     """Format race time in minutes:seconds.milliseconds format."""
-    minutes = int(seconds // 60)
-    remaining_seconds = int(seconds % 60)
-    milliseconds = int((seconds - int(seconds)) * 1000)
-    return f"{minutes:02d}:{remaining_seconds:02d}.{milliseconds:03d}"
+    return format_race_times([seconds])[0]
 
-def plot_race_progress(results, laps):
-    """Plot race progress showing positions by lap with realistic race dynamics."""
+def plot_race_progress(results, laps, dpi=150):
+    """Plot race progress showing positions by lap with realistic race dynamics.
+    
+    Args:
+        results: List of DriverRaceResult objects
+        laps: Number of laps in the race
+        dpi: Resolution of the saved PNG
+    """
+    result_by_driver = {r.driver: r for r in results}
+    
     # Get top drivers to display
     top_drivers = [r.driver for r in results[:10]]
-    driver_names = [r.driver.name for r in results[:10]]
+    n_drivers = len(top_drivers)
+    start_positions = np.array([result_by_driver[d].starting_position for d in top_drivers], dtype=int)
+    end_positions = np.array([result_by_driver[d].finishing_position for d in top_drivers], dtype=int)
+    overtaking = np.array([d.skill_overtaking for d in top_drivers], dtype=float)
     
-    # Generate realistic position data
-    positions = np.zeros((laps, len(top_drivers)), dtype=int)
+    # Only drivers who start in the top 10 are plotted
+    in_top10 = start_positions <= 10
+    plotted = np.flatnonzero(in_top10)
     
-    # Starting positions
-    for i, driver in enumerate(top_drivers):
-        start_pos = next(r.starting_position for r in results if r.driver == driver)
-        # Convert position to array index (0-based)
-        if start_pos <= 10:  # Only track top 10
-            positions[0, i] = start_pos
+    # Generate realistic position data
+    positions = np.empty((laps, n_drivers), dtype=np.int8)
     
     # Generate realistic position changes considering:
     # - Strong starts/poor starts
@@ -116,137 +223,92 @@ def plot_race_progress(results, laps):
     # - Convergence to final positions
     
     # Simulate pit stop laps (typically 1-3 stops depending on track)
-    pit_stop_count = random.randint(1, 3)
+    pit_stop_count = int(_RNG.integers(1, 4))
     race_distance = 1/3 if pit_stop_count == 1 else 1/4 if pit_stop_count == 2 else 1/5
     
-    pit_stops = {}
-    for i, driver in enumerate(top_drivers):
-        # Create realistic pit stop laps
-        driver_pit_stops = []
-        for stop in range(pit_stop_count):
-            # Distribute stops throughout race with some variation between drivers
-            base_lap = int((stop + 1) * race_distance * laps)
-            variation = random.randint(-3, 3)
-            pit_lap = min(max(base_lap + variation, 5), laps-5)  # Keep within sensible bounds
-            driver_pit_stops.append(pit_lap)
-        pit_stops[i] = driver_pit_stops
-    
-    # Fill in position progression
-    for i, driver in enumerate(top_drivers):
-        start_pos = next(r.starting_position for r in results if r.driver == driver)
-        if start_pos > 10:  # Skip drivers who start outside top 10
-            continue
-            
-        end_pos = next(r.finishing_position for r in results if r.driver == driver)
+    # Distribute stops throughout race with some variation between drivers,
+    # keeping them within sensible bounds
+    base_laps = ((np.arange(pit_stop_count) + 1) * race_distance * laps).astype(int)
+    pit_stops = np.clip(base_laps + _RNG.integers(-3, 4, (n_drivers, pit_stop_count)), 5, laps - 5)
+    
+    # pit_mask[lap, i] is True when driver i pits on that lap
+    pit_mask = np.zeros((laps, n_drivers), dtype=bool)
+    on_track = (pit_stops >= 0) & (pit_stops < laps)
+    pit_mask[pit_stops[on_track], np.nonzero(on_track)[0]] = True
+    
+    # Start phase (first 10% of race) - more position changes
+    first_phase = int(laps * 0.1)
+    # Middle phase - more stable with occasional position changes
+    middle_phase = int(laps * 0.7)
+    
+    # Early race - more position changes, especially for better drivers
+    skill_factor = (overtaking - 80) / 20  # Normalize to approximately -1 to 1
+    early_change_prob = 0.2 + (0.1 * skill_factor)
+    
+    # Draw every lap's random numbers up front
+    change_rolls = _RNG.random((laps, n_drivers))
+    early_steps = _RNG.integers(1, 3, (laps, n_drivers))
+    pit_effects = _RNG.integers(2, 5, (laps, n_drivers))  # Lose 2-4 places
+    
+    # Simulate position changes throughout the race, all drivers at once
+    current_pos = start_positions.copy()
+    positions[0] = start_positions
+    for lap in range(1, laps):
+        # Position change probability varies by race phase
+        if lap < first_phase:
+            change_prob, step = early_change_prob, early_steps[lap]
+        elif lap < middle_phase:
+            # Middle race - more stable
+            change_prob, step = 0.05, 1
+        else:
+            # End race - some final position battles
+            change_prob, step = 0.1, 1
         
-        # Convert to 0-based for array indexing but keep 1-based for display
-        positions[0, i] = start_pos
+        # Direction of position change tends toward final position
+        direction = np.sign(end_positions - current_pos)
+        position_change = np.where(change_rolls[lap] < change_prob, step * direction, 0)
         
-        current_pos = start_pos
+        # Apply pit effect (always negative - lose positions)
+        position_change = np.where(pit_mask[lap], pit_effects[lap], position_change)
         
-        # Start phase (first 10% of race) - more position changes
-        first_phase = int(laps * 0.1)
-        # Middle phase - more stable with occasional position changes
-        middle_phase = int(laps * 0.7)
+        # Ensure position remains in valid range
+        new_pos = np.clip(current_pos + position_change, 1, 10)
         
-        # Simulate position changes throughout the race
-        for lap in range(1, laps):
-            # Check if this is a pit stop lap
-            pit_effect = 0
-            if lap in pit_stops[i]:
-                # Lose positions during pit stop
-                pit_effect = random.randint(2, 4)  # Lose 2-4 places
-            
-            # Position change probability varies by race phase
-            if lap < first_phase:
-                # Early race - more position changes, especially for better drivers
-                driver_skill = next(d.skill_overtaking for d in top_drivers if d == driver)
-                skill_factor = (driver_skill - 80) / 20  # Normalize to approximately -1 to 1
-                change_prob = 0.2 + (0.1 * skill_factor)
-                max_change = 2
-            elif lap < middle_phase:
-                # Middle race - more stable
-                change_prob = 0.05
-                max_change = 1
-            else:
-                # End race - some final position battles
-                change_prob = 0.1
-                max_change = 1
-            
-            # Direction of position change tends toward final position
-            direction = -1 if current_pos > end_pos else 1 if current_pos < end_pos else 0
-            
-            # Determine position change
-            if random.random() < change_prob and direction != 0:
-                position_change = random.randint(1, max_change) * direction
-            else:
-                position_change = 0
-                
-            # Apply pit effect (always negative - lose positions)
-            if pit_effect > 0:
-                position_change = pit_effect
-            
-            # Calculate new position
-            new_pos = current_pos + position_change
-            
-            # Ensure position remains in valid range
-            new_pos = max(1, min(new_pos, 10))
-            
-            # Force convergence to final position in last 10% of race
-            if lap > laps * 0.9:
-                if new_pos < end_pos:
-                    new_pos += min(1, end_pos - new_pos)
-                elif new_pos > end_pos:
-                    new_pos -= min(1, new_pos - end_pos)
-            
-            positions[lap, i] = new_pos
-            current_pos = new_pos
-            
-        # Ensure final position is correct
-        positions[-1, i] = end_pos
+        # Force convergence to final position in last 10% of race
+        if lap > laps * 0.9:
+            new_pos += np.sign(end_positions - new_pos)
+        
+        positions[lap] = new_pos
+        current_pos = new_pos
+    
+    # Ensure final position is correct
+    positions[-1] = end_positions
     
     # Create the visualization
-    plt.figure(figsize=(14, 9))
-    
-    # Use team colors for drivers (approximated)
-    team_colors = {
-        'Red Bull Racing': '#0600EF',  # Dark blue
-        'Ferrari': '#DC0000',          # Red
-        'Mercedes': '#00D2BE',         # Teal
-        'McLaren': '#FF8700',          # Orange
-        'Aston Martin': '#006F62',     # Green
-        'Alpine': '#0090FF',           # Blue
-        'Williams': '#005AFF',         # Blue
-        'Racing Bulls': '#052C5A',     # Navy
-        'Kick Sauber': '#52E252',      # Green
-        'Haas': '#FFFFFF'              # White
-    }
-    
-    # Create x-axis ticks at regular intervals
-    xticks_step = max(1, laps // 10)
-    xticks = list(range(0, laps, xticks_step))
-    if laps - 1 not in xticks:
-        xticks.append(laps - 1)
-    
-    # Plot each driver's position
-    for i, driver in enumerate(top_drivers):
-        # Skip drivers who don't start in top 10
-        if next(r.starting_position for r in results if r.driver == driver) > 10:
-            continue
-            
-        color = team_colors.get(driver.team, f'C{i}')  # Use team color or fallback
-        
-        # Plot the main line
-        plt.plot(range(laps), positions[:, i], label=driver.name, color=color, linewidth=2.5)
-        
-        # Mark pit stops with vertical lines
-        for pit_lap in pit_stops[i]:
-            if 0 <= pit_lap < laps:
-                plt.axvline(x=pit_lap, ymin=0, ymax=0.03, color=color, linewidth=1.5)
-        
-        # Add points to mark major events (race start, race end)
-        plt.plot(0, positions[0, i], 'o', color=color, markersize=8)
-        plt.plot(laps-1, positions[-1, i], 'D', color=color, markersize=8)
+    fig = plt.figure(figsize=(14, 9))
+    
+    # Plot every top-10 starter's position line as a single collection
+    ax = plt.gca()
+    colors = [TEAM_COLORS.get(top_drivers[i].team, f'C{i}') for i in plotted]  # Use team color or fallback
+    lap_axis = np.broadcast_to(np.arange(laps)[None, :], (len(plotted), laps))
+    lines = np.stack((lap_axis, positions[:, in_top10].T), axis=-1)
+    ax.add_collection(LineCollection(lines, colors=colors, linewidths=2.5, zorder=2))
+    ax.autoscale_view()
+    
+    # Mark pit stops with short vertical lines along the bottom of the axes
+    pit_laps = pit_stops[in_top10].ravel()
+    pit_colors = np.repeat(colors, pit_stops.shape[1])
+    on_track = (pit_laps >= 0) & (pit_laps < laps)
+    ax.vlines(pit_laps[on_track], 0, 0.03, colors=pit_colors[on_track],
+              linewidth=1.5, transform=ax.get_xaxis_transform())
+    
+    # Add points to mark major events (race start, race end)
+    ax.scatter(np.zeros(len(plotted)), positions[0, in_top10], marker='o', c=colors, s=64, zorder=3)
+    ax.scatter(np.full(len(plotted), laps - 1), positions[-1, in_top10], marker='D', c=colors, s=64, zorder=3)
+    
+    # Legend entries for the collection's lines
+    legend_handles = [Line2D([], [], color=color, linewidth=2.5, label=top_drivers[i].name)
+                      for i, color in zip(plotted, colors)]
     
     # Set plot properties
     plt.gca().invert_yaxis()  # Invert Y-axis so position 1 is at the top
@@ -254,23 +316,18 @@ def plot_race_progress(results, laps):
     plt.title('Race Position Progression by Lap', fontsize=16, fontweight='bold')
     plt.xlabel('Lap', fontsize=12)
     plt.ylabel('Position', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.legend(loc='center left', bbox_to_anchor=(1, 0.5))
+    plt.legend(handles=legend_handles, loc='center left', bbox_to_anchor=(1, 0.5))
     
     # Add grid in the background
     plt.grid(True, linestyle='-', alpha=0.1)
     
-    # Highlight first/last laps with vertical lines
-    plt.axvline(x=0, color='black', linestyle='-', alpha=0.3, label='_nolegend_')
-    plt.axvline(x=laps-1, color='black', linestyle='-', alpha=0.3, label='_nolegend_')
-    
     # Add text annotations for race phases
     plt.text(laps*0.05, 0.5, 'START', ha='center', fontsize=8, 
-             bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+             bbox=_ANNOT_BBOX)
     plt.text(laps*0.5, 0.5, 'MID RACE', ha='center', fontsize=8,
-             bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+             bbox=_ANNOT_BBOX)
     plt.text(laps*0.95, 0.5, 'FINISH', ha='center', fontsize=8,
-             bbox=dict(boxstyle='round', facecolor='white', alpha=0.7))
+             bbox=_ANNOT_BBOX)
     
     # For each pit stop window, add a shaded area
     for window in range(pit_stop_count):
@@ -280,7 +337,7 @@ def plot_race_progress(results, laps):
         plt.text(
             (window_start + window_end) / 2, 0.5, 
             f'PIT WINDOW {window+1}', ha='center', fontsize=8,
-            bbox=dict(boxstyle='round', facecolor='white', alpha=0.7)
+            bbox=_ANNOT_BBOX
         )
     
     # Add a title with race information
@@ -291,242 +348,263 @@ def plot_race_progress(results, laps):
     # Import the helper function for consistent naming
     from utils.visualization_graphs import get_formatted_filename
     
-    # Extract track name from first result
-    track_name = next(iter(results)).team.name  # Fallback value
-    if hasattr(results[0], 'track_name'):
-        track_name = results[0].track_name
-        
+    # Extract track name from first result, falling back to its team name
+    track_name = getattr(results[0], 'track_name', results[0].team.name)
+    
     # Create filename with the new format
     filename = get_formatted_filename("race_progress", track_name) + ".png"
     save_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualized-graphs", filename)
-    plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    print(f"\n{Fore.GREEN}Enhanced race progress plot saved to '{filename}'{Style.RESET_ALL}")
+    plt.savefig(save_path, dpi=dpi)
+    plt.close(fig)
+    print(f"\n{_FG}Enhanced race progress plot saved to '{filename}'")
 
-def simulate_live_race_progress(results, laps, track_name):
-    """Simulate live race progress with animated console updates."""
-    print(f"\n{Fore.GREEN}SIMULATING LIVE RACE - {track_name}{Style.RESET_ALL}")
-    print("-" * 60)
+def simulate_live_race_progress(results, laps, track_name, display_every=None):
+    """Simulate live race progress with animated console updates.
+    
+    Args:
+        results: List of DriverRaceResult objects
+        laps: Number of laps in the race
+        track_name: Name of the track
+        display_every: Show the standings every this many laps. Defaults to
+            about 20 updates per race, or only the final standings without
+            a terminal
+    
+    Raises:
+        ValueError: If display_every is less than 1
+    """
+    if display_every is not None and display_every < 1:
+        raise ValueError(f"display_every must be at least 1, got {display_every}")
+    
+    sys.stdout.write(f"\n{_FG}SIMULATING LIVE RACE - {track_name}{_RST}\n" + "-" * 60 + "\n")
     
     # Get top 10 drivers for display
     top_drivers = [r.driver for r in results[:10]]
     
     # Generate realistic position changes during the race
-    positions = {}
-    last_position = {}
-    sector_times = {}
-    fastest_sectors = [{} for _ in range(3)]  # 3 sectors
-    fastest_lap = {"driver": None, "time": float('inf')}
-    
-    for driver in top_drivers:
-        # Start at qualifying position and end at final position
-        start_pos = next(r.starting_position for r in results if r.driver == driver)
-        end_pos = next(r.finishing_position for r in results if r.driver == driver)
-        last_position[driver] = start_pos
+    result_by_driver = {r.driver: r for r in results}
+    n_drivers = len(top_drivers)
+    
+    # Draw every driver's random position changes up front
+    change_rolls = _RNG.random((n_drivers, laps))
+    gain_steps = _RNG.integers(1, 3, (n_drivers, laps))
+    drop_rolls = _RNG.random((n_drivers, laps))
+    drop_steps = _RNG.integers(1, 3, (n_drivers, laps))
+    highlight_rolls = _RNG.random(laps)
+    
+    # Start at qualifying position and end at final position
+    start_positions = np.array([result_by_driver[d].starting_position for d in top_drivers])
+    end_positions = np.array([result_by_driver[d].finishing_position for d in top_drivers])
+    overtaking_factor = np.array([d.skill_overtaking for d in top_drivers]) / 100
+    last_position = start_positions.tolist()
+    
+    lap_numbers = np.arange(laps)
+    
+    # First lap has more position changes, the early race has more changes
+    # as cars settle into rhythm, mid race is more stable and the late race
+    # has some changes due to strategy/tire wear
+    change_probability = np.select(
+        [lap_numbers == 1, lap_numbers < laps * 0.2, lap_numbers < laps * 0.7],
+        [0.35, 0.15, 0.05], 0.08)
+    
+    # Early in race, bigger position changes are possible
+    gain_steps = np.where(lap_numbers < laps * 0.3, gain_steps, 1)
+    
+    # More likely to drop back in second half of race (tire wear/strategy)
+    drop_probability = np.where(lap_numbers > laps * 0.5, 0.3, 0.1)
+    
+    # Create a realistic position progression for all drivers at once,
+    # one row of positions per lap
+    lap_positions = np.empty((laps, n_drivers), dtype=np.int8)
+    current_pos = start_positions
+    lap_positions[0] = current_pos
+    for lap in range(1, laps):
+        # Adjust probability based on driver's overtaking skill and current position
+        position_factor = 1 + (current_pos - 5) / 10  # Higher positions have fewer changes
+        final_probability = change_probability[lap] * overtaking_factor * position_factor
+        changes = change_rolls[:, lap] < final_probability
         
-        # Create a realistic position progression
-        current_pos = start_pos
-        driver_positions = [current_pos]
+        # Strategic progression toward final position with varied step sizes
+        move_up = changes & (current_pos > end_positions)
+        drop_back = changes & (current_pos < end_positions) & (drop_rolls[:, lap] < drop_probability[lap])
+        current_pos = np.where(move_up, np.maximum(1, current_pos - gain_steps[:, lap]), current_pos)
+        current_pos = np.where(drop_back, np.minimum(n_drivers, current_pos + drop_steps[:, lap]), current_pos)
         
-        # Initial pace based on driver/car performance
-        driver_result = next(r for r in results if r.driver == driver)
+        # Force convergence to final position in last 20%
+        if lap > laps * 0.8:
+            current_pos = current_pos + np.sign(end_positions - current_pos)
         
-        # Simulate race performance with more realistic patterns
-        for lap in range(1, laps):
-            # First lap has more position changes
-            if lap == 1:
-                change_probability = 0.35
-            # Early race has more changes as cars settle into rhythm
-            elif lap < laps * 0.2:
-                change_probability = 0.15
-            # Mid race is more stable
-            elif lap < laps * 0.7:
-                change_probability = 0.05
-            # Late race has some changes due to strategy/tire wear
-            else:
-                change_probability = 0.08
-            
-            # Adjust probability based on driver's overtaking skill and current position
-            overtaking_factor = driver.skill_overtaking / 100
-            position_factor = 1 + (current_pos - 5) / 10  # Higher positions have fewer changes
-            final_probability = change_probability * overtaking_factor * position_factor
-            
-            if random.random() < final_probability:
-                # Strategic progression toward final position with varied step sizes
-                if current_pos > end_pos:  # Need to move up
-                    # Early in race, bigger position changes are possible
-                    max_step = 2 if lap < laps * 0.3 else 1
-                    step = random.randint(1, max_step)
-                    current_pos = max(1, current_pos - step)
-                elif current_pos < end_pos:  # Will drop back
-                    # More likely to drop back in second half of race (tire wear/strategy)
-                    drop_probability = 0.3 if lap > laps * 0.5 else 0.1
-                    if random.random() < drop_probability:
-                        step = random.randint(1, 2)
-                        current_pos = min(len(top_drivers), current_pos + step)
-            
-            # Keep within bounds and ensure progression toward final position
-            if lap > laps * 0.8:  # Force convergence to final position in last 20%
-                if current_pos < end_pos:
-                    current_pos += min(1, end_pos - current_pos)
-                elif current_pos > end_pos:
-                    current_pos -= min(1, current_pos - end_pos)
-                    
-            driver_positions.append(current_pos)
-        
-        # Ensure final position is correct
-        driver_positions[-1] = end_pos
-        positions[driver] = driver_positions
-    
-    # Simulate sector and lap times with realistic patterns
-    for driver in top_drivers:
-        # Base lap time varies by track but typically around 90 seconds
-        base_lap_time = 90.0 + random.uniform(-3, 3)
-        driver_consistency = driver.consistency / 100
-        
-        # Better drivers have slightly faster base times
-        skill_factor = driver.skill_dry / 100
-        base_lap_time -= (skill_factor - 0.8) * 2.0
-        
-        sector_times[driver] = []
-        
-        for lap in range(laps):
-            # Fuel effect - cars get faster as fuel burns off (about 0.1s per lap)
-            fuel_effect = -0.1 * min(lap, laps * 0.7)  # Effect diminishes after 70%
-            
-            # Tire effect - performance drops after peak (around lap 6-10 for softer compounds)
-            if lap < 5:  # Warming up
-                tire_effect = -0.05 * lap
-            elif lap < 10:  # Peak performance
-                tire_effect = -0.25
-            else:  # Degradation (more pronounced for less consistent drivers)
-                tire_effect = 0.02 * (lap - 10) * (1.2 - driver_consistency)
-            
-            # Random variation inversely proportional to consistency
-            variation = random.uniform(-0.8, 0.8) * (1.1 - driver_consistency)
-            
-            # Calculated lap time with all effects
-            lap_time = base_lap_time + fuel_effect + tire_effect + variation
-            
-            # Generate realistic sector times (sum to lap time)
-            s1_percent = random.uniform(0.28, 0.32)
-            s2_percent = random.uniform(0.38, 0.42)
-            s3_percent = 1 - s1_percent - s2_percent
-            
-            s1 = lap_time * s1_percent
-            s2 = lap_time * s2_percent
-            s3 = lap_time * s3_percent
-            
-            # Track fastest sectors
-            if lap > 0:  # Skip formation lap
-                for i, sector_time in enumerate([s1, s2, s3]):
-                    if driver not in fastest_sectors[i] or sector_time < fastest_sectors[i].get(driver, float('inf')):
-                        fastest_sectors[i][driver] = sector_time
-            
-            sector_times[driver].append((s1, s2, s3, lap_time))
-            
-            # Track fastest lap
-            if lap_time < fastest_lap["time"]:
-                fastest_lap["driver"] = driver
-                fastest_lap["time"] = lap_time
-    
-    # Display race progress with enhanced information
-    laps_to_show = min(laps, 20)  # Limit to avoid console spam
-    lap_interval = max(1, laps // laps_to_show)
-    
-    for lap in range(0, laps, lap_interval):
-        if lap > 0:
+        lap_positions[lap] = current_pos
+    
+    # Ensure final position is correct
+    lap_positions[-1] = end_positions
+    
+    # Simulate sector and lap times with realistic patterns, as a
+    # (drivers, laps, 4) array of (s1, s2, s3, lap time)
+    consistency = np.array([d.consistency for d in top_drivers], dtype=float) / 100
+    skill_factor = np.array([d.skill_dry for d in top_drivers], dtype=float) / 100
+    
+    # Base lap time varies by track but typically around 90 seconds
+    # Better drivers have slightly faster base times
+    base_lap_time = 90.0 + _RNG.uniform(-3, 3, n_drivers) - (skill_factor - 0.8) * 2.0
+    
+    lap_numbers = np.arange(laps)
+    
+    # Fuel effect - cars get faster as fuel burns off (about 0.1s per lap)
+    fuel_effect = -0.1 * np.minimum(lap_numbers, laps * 0.7)  # Effect diminishes after 70%
+    
+    # Tire effect - warming up, peak performance (around lap 6-10 for softer
+    # compounds), then degradation (more pronounced for less consistent drivers)
+    tire_effect = np.where(
+        lap_numbers < 5, -0.05 * lap_numbers,
+        np.where(lap_numbers < 10, -0.25,
+                 0.02 * (lap_numbers - 10) * (1.2 - consistency[:, None]))
+    )
+    
+    # Random variation inversely proportional to consistency
+    variation = _RNG.uniform(-0.8, 0.8, (n_drivers, laps)) * (1.1 - consistency[:, None])
+    
+    # Calculated lap time with all effects
+    lap_times = base_lap_time[:, None] + fuel_effect + tire_effect + variation
+    
+    # Generate realistic sector times (sum to lap time)
+    s1_percent = _RNG.uniform(0.28, 0.32, (n_drivers, laps))
+    s2_percent = _RNG.uniform(0.38, 0.42, (n_drivers, laps))
+    sector_times = np.empty((n_drivers, laps, 4))
+    sector_times[:, :, 0] = lap_times * s1_percent
+    sector_times[:, :, 1] = lap_times * s2_percent
+    sector_times[:, :, 2] = lap_times * (1 - s1_percent - s2_percent)
+    sector_times[:, :, 3] = lap_times
+    
+    # Cumulative race time at the end of each lap, for gaps to the leader
+    race_times = lap_times.cumsum(axis=1)
+    
+    # Each driver's fastest time in each of the 3 sectors, skipping the formation lap
+    best_sectors = sector_times[:, 1:, :3].min(axis=1)
+    
+    # Fastest lap of the race
+    fastest_lap_driver, fastest_lap_index = np.unravel_index(lap_times.argmin(), lap_times.shape)
+    fastest_lap_time = lap_times[fastest_lap_driver, fastest_lap_index]
+    
+    # The live table layout is fixed for the whole race, so size its columns once
+    number_widths = [len(f"{sector_times[:, :, k].max():.3f}") for k in range(4)]
+    max_gap = np.ptp(race_times, axis=0).max() if n_drivers else 0.0
+    live_widths = (
+        len(LIVE_HEADERS[0]),
+        3,  # Position change indicator, e.g. "↑2"
+        max([len(LIVE_HEADERS[2])] + [len(d.name) for d in top_drivers]),
+        max([len(LIVE_HEADERS[3])] + [len(d.team) for d in top_drivers]),
+        max(len(LIVE_HEADERS[4]), sum(number_widths) + 4 + 3 * len(" | ")),
+        max(len(LIVE_HEADERS[5]), len("LEADER"), len(f"+-{max_gap:.3f}s"))
+    )
+    live_header = _pipe_row(LIVE_HEADERS, live_widths, LIVE_ALIGNS)
+    live_separator = _pipe_separator(live_widths, LIVE_ALIGNS)
+    
+    # Display race progress with enhanced information. Without a terminal
+    # (output piped or redirected) skip the animation and by default show
+    # only the final lap
+    headless = not sys.stdout.isatty()
+    if display_every is None and headless:
+        display_laps = range(laps - 1, laps)
+    else:
+        if display_every is None:
+            display_every = max(1, laps // 20)  # Limit to avoid console spam
+        display_laps = range(0, laps, display_every)
+    
+    # Highlights become available as the race goes on
+    mid_highlights = RACE_HIGHLIGHTS + (PIT_WINDOW_HIGHLIGHT,)
+    late_highlights = mid_highlights + (TIRE_WEAR_HIGHLIGHT,)
+    
+    for lap in display_laps:
+        if lap > 0 and not headless:
             time.sleep(0.5)  # Small delay between lap updates
             
         lap_display = lap + 1
-        print(f"\n{Fore.CYAN}Lap {lap_display}/{laps}{Style.RESET_ALL}")
-        print("-" * 60)
         
-        # Get current positions for this lap
-        current_positions = [(driver, positions[driver][lap]) for driver in top_drivers]
-        current_positions.sort(key=lambda x: x[1])
+        # Collect the whole update and write it at once. Colors are reset
+        # explicitly since the autoreset only applies at the end of a write
+        lines = [f"\n{_FC}Lap {lap_display}/{laps}{_RST}", "-" * 60]
+        
+        # Get current running order for this lap (stable, so ties keep results order)
+        running_order = np.argsort(lap_positions[lap], kind='stable').tolist()
+        leader_idx = running_order[0]
         
         # Prepare display table
-        table_data = []
+        table_rows = [live_header, live_separator]
         
         # Track position changes for display
-        for pos, (driver, position) in enumerate(current_positions, 1):
-            prev_pos = last_position.get(driver, pos)
-            pos_change = prev_pos - pos
+        for pos, idx in enumerate(running_order, 1):
+            driver = top_drivers[idx]
+            pos_change = last_position[idx] - pos
             
             if pos_change > 0:
-                pos_indicator = f"{Fore.GREEN}↑{pos_change}{Style.RESET_ALL}"
+                pos_indicator = _POS_UP.format(pos_change)
             elif pos_change < 0:
-                pos_indicator = f"{Fore.RED}↓{abs(pos_change)}{Style.RESET_ALL}"
+                pos_indicator = _POS_DOWN.format(-pos_change)
             else:
                 pos_indicator = "  "
                 
             # Get sector times
-            if lap < len(sector_times[driver]):
-                s1, s2, s3, lap_time = sector_times[driver][lap]
-                
-                # Highlight fastest sectors if this is the lap with fastest sector
-                s1_color = Fore.MAGENTA if fastest_sectors[0].get(driver) == s1 else ""
-                s2_color = Fore.MAGENTA if fastest_sectors[1].get(driver) == s2 else ""
-                s3_color = Fore.MAGENTA if fastest_sectors[2].get(driver) == s3 else ""
-                lap_color = Fore.MAGENTA if fastest_lap["driver"] == driver and fastest_lap["time"] == lap_time else ""
-                
-                time_display = f"{s1_color}{s1:.3f}s{Style.RESET_ALL} | {s2_color}{s2:.3f}s{Style.RESET_ALL} | {s3_color}{s3:.3f}s{Style.RESET_ALL} | {lap_color}{lap_time:.3f}s{Style.RESET_ALL}"
-            else:
-                time_display = "Starting grid"
+            s1, s2, s3, lap_time = sector_times[idx, lap]
+            
+            # Highlight fastest sectors if this is the lap with fastest sector
+            times = [
+                f"{value:{width}.3f}s" for value, width in zip((s1, s2, s3, lap_time), number_widths)
+            ]
+            for i in range(3):
+                if best_sectors[idx, i] == sector_times[idx, lap, i]:
+                    times[i] = f"{_FM}{times[i]}{_RST}"
+            if idx == fastest_lap_driver and lap == fastest_lap_index:
+                times[3] = f"{_FM}{times[3]}{_RST}"
+            
+            time_display = " | ".join(times)
                 
             # Get gap to leader
             if pos == 1:
                 gap_display = "LEADER"
             else:
-                leader_driver = current_positions[0][0]
-                if lap < len(sector_times[leader_driver]) and lap < len(sector_times[driver]):
-                    # Cumulative time gap to leader
-                    leader_total = sum(t[3] for t in sector_times[leader_driver][:lap+1])
-                    driver_total = sum(t[3] for t in sector_times[driver][:lap+1])
-                    gap = driver_total - leader_total
-                    gap_display = f"+{gap:.3f}s"
-                else:
-                    gap_display = ""
+                # Cumulative time gap to leader
+                gap = race_times[idx, lap] - race_times[leader_idx, lap]
+                gap_display = f"+{gap:.3f}s"
             
-            table_data.append([
-                f"{pos:2d}",
-                f"{pos_indicator}",
-                f"{driver.name:20s}",
-                f"{driver.team:15s}",
-                time_display,
-                gap_display
-            ])
+            table_rows.append(_pipe_row(
+                (str(pos), pos_indicator, driver.name, driver.team, time_display, gap_display),
+                live_widths, LIVE_ALIGNS
+            ))
             
             # Update last position for next lap
-            last_position[driver] = pos
+            last_position[idx] = pos
         
         # Display the table
-        headers = ["Pos", "Δ", "Driver", "Team", "Sectors | Lap Time", "Gap"]
-        print(tabulate_func(table_data, headers=headers, tablefmt="pipe"))
+        lines.extend(table_rows)
         
         # Show race highlights occasionally
-        if random.random() < 0.2 and lap > 0:
-            highlight_types = [
-                f"{Fore.YELLOW}Good defending from {random.choice(top_drivers).name} against {random.choice(top_drivers).name}!{Style.RESET_ALL}",
-                f"{Fore.CYAN}DRS enabled for {random.choice(top_drivers).name} - closing in!{Style.RESET_ALL}",
-                f"{Fore.GREEN}Great overtake at Turn {random.randint(1, 15)}!{Style.RESET_ALL}",
-                f"{Fore.RED}Lock-up for {random.choice(top_drivers).name} at Turn {random.randint(1, 15)}{Style.RESET_ALL}",
-                f"{Fore.YELLOW}Yellow flags in sector {random.randint(1, 3)} - incident being investigated{Style.RESET_ALL}"
-            ]
-            if lap > laps // 3:
-                highlight_types.append(f"{Fore.CYAN}Pit window is now open - expecting stops soon{Style.RESET_ALL}")
+        if highlight_rolls[lap] < 0.2 and lap > 0:
             if lap > laps // 2:
-                highlight_types.append(f"{Fore.CYAN}Teams reporting tire degradation becoming significant{Style.RESET_ALL}")
-                
-            print(f"\n{random.choice(highlight_types)}")
+                highlight_types = late_highlights
+            elif lap > laps // 3:
+                highlight_types = mid_highlights
+            else:
+                highlight_types = RACE_HIGHLIGHTS
+            
+            template = highlight_types[_RNG.integers(len(highlight_types))]
+            driver_idx, rival_idx = _RNG.integers(n_drivers, size=2)
+            lines.append("\n" + template.format(
+                driver=top_drivers[driver_idx].name,
+                rival=top_drivers[rival_idx].name,
+                turn=_RNG.integers(1, 16),
+                sector=_RNG.integers(1, 4)
+            ) + _RST)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     # Display race summary
-    print(f"\n{Fore.GREEN}RACE COMPLETED!{Style.RESET_ALL}")
+    lines = [f"\n{_FG}RACE COMPLETED!{_RST}"]
     
     # Display final fastest lap and sectors
-    print(f"\n{Fore.MAGENTA}FASTEST LAP: {fastest_lap['driver'].name} - {fastest_lap['time']:.3f}s{Style.RESET_ALL}")
-    print("\nFastest Sectors:")
-    for i, sector in enumerate(fastest_sectors, 1):
-        fastest_driver = min(sector.items(), key=lambda x: x[1])
-        print(f"Sector {i}: {fastest_driver[0].name} - {fastest_driver[1]:.3f}s")
+    lines.append(f"\n{_FM}FASTEST LAP: {top_drivers[fastest_lap_driver].name} - {fastest_lap_time:.3f}s{_RST}")
+    lines.append("\nFastest Sectors:")
+    for i, fastest_driver in enumerate(best_sectors.argmin(axis=0)):
+        lines.append(f"Sector {i + 1}: {top_drivers[fastest_driver].name} - {best_sectors[fastest_driver, i]:.3f}s")
+    sys.stdout.write("\n".join(lines) + "\n")
 
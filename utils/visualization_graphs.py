@@ -1,23 +1,106 @@
 """
 Advanced visualization functions for F1 race predictions.
 This module provides additional graph types beyond the basic race progress visualization.
+
+Graphs are only saved to PNG files, so matplotlib is pinned to the
+non-interactive Agg backend and every graph is drawn on one reused figure.
 """
 
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn as sns
-import random
 import datetime
+import hashlib
+import warnings
 from matplotlib.patches import Patch
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection, PolyCollection
 import os
 
+from utils._fastsim import compute_lap_times, compute_tire_curve
+
 # Create visualized-graphs directory if it doesn't exist
 GRAPH_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "visualized-graphs")
 if not os.path.exists(GRAPH_DIR):
     os.makedirs(GRAPH_DIR)
 
+def _plot_dpi(default=120):
+    """Read the saved graph resolution from F1_PLOT_DPI, falling back to the default."""
+    value = os.environ.get("F1_PLOT_DPI")
+    if not value:
+        return default
+    
+    try:
+        dpi = int(value)
+    except ValueError:
+        dpi = 0
+    if dpi <= 0:
+        warnings.warn(f"Ignoring F1_PLOT_DPI={value!r}, expected a positive whole number; "
+                      f"using {default} dpi")
+        return default
+    return dpi
+
+# Resolution of the saved graphs, override with the F1_PLOT_DPI environment variable
+DEFAULT_DPI = _plot_dpi()
+
+# Figure shared by all graphs, cleared and resized for each one
+_FIG = None
+
+# Last set of graphs from generate_all_visualizations, as (race key, paths)
+_LAST_VISUALIZATIONS = None
+
+# Team colors for consistency across charts
+TEAM_COLORS = {
+    'Red Bull Racing': '#0600EF',  # Dark blue
+    'Ferrari': '#DC0000',          # Red
+    'Mercedes': '#00D2BE',         # Teal
+    'McLaren': '#FF8700',          # Orange
+    'Aston Martin': '#006F62',     # Green
+    'Alpine': '#0090FF',           # Blue
+    'Williams': '#005AFF',         # Blue
+    'Racing Bulls': '#052C5A',     # Navy
+    'Kick Sauber': '#52E252',      # Green
+    'Haas': '#FFFFFF'              # White
+}
+
+# Team colors usable for lines, white would vanish against the plot background
+_LINE_COLORS = {team: color for team, color in TEAM_COLORS.items() if color != '#FFFFFF'}
+
+# Tire compound colors
+COMPOUND_COLORS = {'SOFT': 'red', 'MEDIUM': 'yellow', 'HARD': 'white',
+                   'INTERMEDIATE': 'green', 'WET': 'blue'}
+
+# Tire degradation factors by compound (harder tires degrade slower)
+DEG_FACTORS = {'SOFT': 0.6, 'MEDIUM': 0.4, 'HARD': 0.25}
+
+# Shared random generator for the simulated chart data
+_RNG = np.random.default_rng()
+
+def _reset_figure(figsize):
+    """
+    Clear the shared figure and make it current for the pyplot calls that follow.
+    
+    Args:
+        figsize: Figure size (width, height) in inches
+    
+    Returns:
+        The shared matplotlib Figure
+    """
+    global _FIG
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG = plt.figure(figsize=figsize)
+    else:
+        _FIG.clear()
+        _FIG.set_size_inches(figsize)
+        # Undo any tight_layout adjustment left by the previous graph
+        _FIG.subplots_adjust(**{side: plt.rcParams['figure.subplot.' + side]
+                                for side in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')})
+        plt.figure(_FIG.number)
+    return _FIG
+
 def get_formatted_filename(base_name, track_name):
     """
     Generate a filename in the format 'graphtype_circuit_date'.
@@ -47,7 +130,7 @@ def plot_tire_degradation(laps, results, track_name):
         results: List of race results
         track_name: Name of the track for the title
     """
-    plt.figure(figsize=(12, 8))
+    _reset_figure((12, 8))
     
     # Get top 5 drivers to display
     top_drivers = [r.driver for r in results[:5]]
@@ -55,84 +138,65 @@ def plot_tire_degradation(laps, results, track_name):
     # Generate tire compound changes
     # We'll simulate typically 1-3 stops
     compounds = ['SOFT', 'MEDIUM', 'HARD', 'SOFT', 'MEDIUM']
-    compounds_colors = {'SOFT': 'red', 'MEDIUM': 'yellow', 'HARD': 'white', 
-                        'INTERMEDIATE': 'green', 'WET': 'blue'}
     
-    # Track segments per driver
-    segments = {}
-    legends = []
+    # Performance curves for every driver, drawn as one collection
+    curve_segments = []
+    curve_colors = [f'C{i}' for i in range(len(top_drivers))]
+    
+    # Compound indicator bands for every driver, drawn as one collection
+    span_verts = []
+    span_colors = []
+    
+    # Resolve each compound slot's color and degradation factor once
+    stint_colors = np.array([COMPOUND_COLORS[compound] for compound in compounds])
+    stint_deg_factors = np.array([DEG_FACTORS.get(compound, DEG_FACTORS['HARD']) for compound in compounds])
+    
+    # Draw every driver's pit stops (1-3) and per-lap noise up front
+    n_drivers = len(top_drivers)
+    stop_counts = _RNG.integers(1, 4, n_drivers)
+    stop_draws = _RNG.integers(15, laps - 14, (n_drivers, 3))
+    noise = _RNG.uniform(-0.05, 0.05, (n_drivers, laps))
     
     for i, driver in enumerate(top_drivers):
         # Number of pit stops for this driver
-        n_stops = random.randint(1, 3)
-        stop_laps = sorted([random.randint(15, laps-15) for _ in range(n_stops)])
+        n_stops = int(stop_counts[i])
+        stop_laps = np.sort(stop_draws[i, :n_stops]).tolist()
         stop_laps = [0] + stop_laps + [laps]
         
-        # Assign compounds
-        driver_compounds = [compounds[j % len(compounds)] for j in range(n_stops + 1)]
-        
-        # Store segments for this driver
-        segments[driver.name] = list(zip(stop_laps, driver_compounds))
+        # Assign compounds, cycling through the compound order
+        stint_ids = np.arange(n_stops + 1) % len(compounds)
         
-        # Initial performance is around 100%
-        performance = 100
-        x_values = [0]
-        y_values = [performance]
+        # Tire starts at ~100% and degrades based on compound, with a
+        # random element to create realistic curves
+        deg_factors = stint_deg_factors[stint_ids]
+        x_values, y_values = compute_tire_curve(stop_laps, deg_factors, noise[i])
+        curve_segments.append(np.column_stack((x_values, y_values)))
         
-        # Color changes for compound changes
-        colors = []
-        
-        # Plot each stint
-        for j in range(len(stop_laps) - 1):
-            start_lap = stop_laps[j]
-            end_lap = stop_laps[j+1]
-            compound = driver_compounds[j]
-            
-            # Degradation factors vary by compound
-            if compound == 'SOFT':
-                deg_factor = 0.6
-            elif compound == 'MEDIUM':
-                deg_factor = 0.4
-            else:  # HARD
-                deg_factor = 0.25
-            
-            # Plot each lap in the stint
-            for lap in range(start_lap + 1, end_lap + 1):
-                # Tire starts at ~100% and degrades based on compound
-                # Random element to create realistic curves
-                random_factor = random.uniform(-0.05, 0.05)
-                
-                # Performance drop accelerates slightly as tires age
-                age_factor = ((lap - start_lap) / 10) ** 1.2
-                performance = 100 - (deg_factor * age_factor * (lap - start_lap) + random_factor)
-                
-                x_values.append(lap)
-                y_values.append(performance)
-                colors.append(compounds_colors[compound])
-                
-            # After pit stop, performance resets to ~100%
-            if j < len(stop_laps) - 2:  # If not the last stint
-                x_values.append(end_lap)
-                y_values.append(100)
-        
-        # Plot the performance curve
-        plt.plot(x_values, y_values, label=f"{driver.name} - {driver.team}", 
-                 linewidth=2, alpha=0.8)
-        
-        # Add compound indicators
-        for j, (lap, compound) in enumerate(segments[driver.name]):
-            if j < len(segments[driver.name]) - 1:
-                next_lap = segments[driver.name][j+1][0]
-                plt.axvspan(lap, next_lap, alpha=0.1, 
-                            color=compounds_colors[compound], ymin=0.98-i*0.05, ymax=1)
+        # Add compound indicators, in lap by axes-height coordinates
+        ymin = 0.98 - i * 0.05
+        for j in range(n_stops + 1):
+            lap, next_lap = stop_laps[j], stop_laps[j+1]
+            span_verts.append(((lap, ymin), (next_lap, ymin), (next_lap, 1), (lap, 1)))
+        span_colors.extend(stint_colors[stint_ids])
+    
+    ax = plt.gca()
+    ax.add_collection(LineCollection(curve_segments, colors=curve_colors, linewidths=2, alpha=0.8))
+    ax.autoscale_view()
+    ax.add_collection(PolyCollection(span_verts, facecolors=span_colors, edgecolors=span_colors,
+                                     alpha=0.1, transform=ax.get_xaxis_transform()),
+                      autolim=False)
     
     # Add a legend for compounds
     compound_patches = [Patch(color=color, alpha=0.5, label=comp) 
-                       for comp, color in compounds_colors.items() 
+                       for comp, color in COMPOUND_COLORS.items() 
                        if comp in ['SOFT', 'MEDIUM', 'HARD']]
     
     # Create legend with drivers and compounds
-    plt.legend()
+    driver_legend = plt.legend(handles=[Line2D([0], [0], color=color, linewidth=2, alpha=0.8,
+                                               label=f"{driver.name} - {driver.team}")
+                                        for driver, color in zip(top_drivers, curve_colors)],
+                               loc='lower right')
+    ax.add_artist(driver_legend)
     plt.grid(True, alpha=0.3)
     plt.title(f'Tire Performance Degradation - {track_name}', fontsize=16)
     plt.xlabel('Lap', fontsize=12)
@@ -140,17 +204,14 @@ def plot_tire_degradation(laps, results, track_name):
     plt.ylim(70, 102)
     
     # Add a second legend for tire compounds
-    ax = plt.gca()
-    second_legend = plt.legend(handles=compound_patches, loc='lower left', 
-                               title='Tire Compounds')
-    ax.add_artist(second_legend)
+    plt.legend(handles=compound_patches, loc='lower left', title='Tire Compounds')
     
     plt.tight_layout()
     
     # Create filename with the new format
     filename = get_formatted_filename("tire_degradation", track_name) + ".png"
     save_path = os.path.join(GRAPH_DIR, filename)
-    plt.savefig(save_path, dpi=300)
+    plt.savefig(save_path, dpi=DEFAULT_DPI)
     return save_path
 
 def plot_lap_time_progression(results, laps, track_name):
@@ -162,27 +223,33 @@ def plot_lap_time_progression(results, laps, track_name):
         laps: Number of laps in the race
         track_name: Name of the track for the title
     """
-    plt.figure(figsize=(12, 8))
+    _reset_figure((12, 8))
     
     # Get top drivers to display
     top_drivers = [r.driver for r in results[:5]]
     
-    # Generate realistic lap times with tire, fuel effects
-    lap_times = {}
-    
     # Base lap time around 90 seconds (adjust based on track if needed)
     base_time = 90.0
     
-    # Team colors for consistency with other charts
-    team_colors = {
-        'Red Bull Racing': '#0600EF',  # Dark blue
-        'Ferrari': '#DC0000',          # Red
-        'Mercedes': '#00D2BE',         # Teal
-        'McLaren': '#FF8700',          # Orange
-        'Aston Martin': '#006F62',     # Green
-    }
+    lap_numbers = np.arange(1, laps + 1)
+    
+    # Draw every driver's pit stops (1-3) and lap time noise up front
+    n_drivers = len(top_drivers)
+    stop_counts = _RNG.integers(1, 4, n_drivers)
+    stop_draws = _RNG.integers(15, laps - 14, (n_drivers, 3))
+    variations = _RNG.standard_normal((n_drivers, laps))
+    
+    # Generate realistic lap times with tire, fuel effects, one row per driver
+    lap_times = np.empty((n_drivers, laps))
+    
+    # Pit stop markers for every driver, drawn as one collection
+    pit_segments = []
+    pit_colors = []
+    
+    # Resolve each driver's line color once, falling back to the color cycle
+    driver_colors = tuple(_LINE_COLORS.get(driver.team, f'C{i}') for i, driver in enumerate(top_drivers))
     
-    for driver in top_drivers:
+    for i, driver in enumerate(top_drivers):
         # Driver-specific base time (better drivers are faster)
         skill_factor = (driver.skill_dry / 100)
         driver_base = base_time * (1 - ((skill_factor - 0.8) / 10))
@@ -190,66 +257,39 @@ def plot_lap_time_progression(results, laps, track_name):
         # Consistency affects variation
         consistency = driver.consistency / 100
         
-        # Generate lap times
-        times = []
-        pit_laps = []
         # Generate random pit stops
-        n_stops = random.randint(1, 3)
-        for _ in range(n_stops):
-            pit_laps.append(random.randint(15, laps-15))
+        pit_laps = stop_draws[i, :stop_counts[i]]
         
-        for lap in range(1, laps + 1):
-            # Effect of fuel load (decreases over time, making car faster)
-            fuel_effect = 0.2 * (1 - min(lap/laps, 1))
-            
-            # Effect of tire wear (increases over time until pit stop)
-            last_pit = 0
-            for pit in sorted(pit_laps):
-                if lap > pit:
-                    last_pit = pit
-            
-            laps_since_pit = lap - last_pit
-            
-            # Tire wear effect (initially improves slightly then degrades)
-            if laps_since_pit <= 3:
-                # New tires take a few laps to warm up
-                tire_effect = 0.3 * (1 - laps_since_pit/3)
-            else:
-                # Then performance degrades
-                tire_effect = 0.01 * (laps_since_pit - 3) ** 1.5
-            
-            # Random variation (more consistent drivers have less variation)
-            variation = random.normalvariate(0, 0.3 * (1 - consistency))
-            
-            # Combined time
-            lap_time = driver_base + fuel_effect + tire_effect + variation
-            
-            # Pit stop adds time
-            if lap in pit_laps:
-                # Mark pit stops with a spike in lap time
-                lap_time += 20  # Approx time lost in pits
-                
-            times.append(lap_time)
+        # Random variation (more consistent drivers have less variation)
+        variation = 0.3 * (1 - consistency) * variations[i]
         
-        # Plot lap times for this driver
-        color = team_colors.get(driver.team, None)
-        plt.plot(range(1, laps + 1), times, 
-                 label=f"{driver.name} ({driver.team})", 
-                 linewidth=1.5, alpha=0.8, color=color)
+        # Fuel and tire wear effects, with a spike on pit stop laps
+        lap_times[i] = compute_lap_times(driver_base, pit_laps, variation, laps)
         
-        # Mark pit stops
+        # Mark pit stops with full-height lines
         for pit in pit_laps:
-            plt.axvline(x=pit, alpha=0.2, linestyle='--', 
-                        color=color or 'gray')
-        
-        lap_times[driver.name] = times
+            pit_segments.append(((pit, 0), (pit, 1)))
+            pit_colors.append(driver_colors[i])
+    
+    # Plot every driver's lap times as one collection
+    ax = plt.gca()
+    lap_axis = np.broadcast_to(lap_numbers, lap_times.shape)
+    ax.add_collection(LineCollection(np.stack((lap_axis, lap_times), axis=-1), colors=driver_colors,
+                                     linewidths=1.5, alpha=0.8))
+    ax.autoscale_view()
+    
+    ax.add_collection(LineCollection(pit_segments, colors=pit_colors, linestyles='--', alpha=0.2,
+                                     transform=ax.get_xaxis_transform()),
+                      autolim=False)
     
     # Styling
     plt.grid(True, alpha=0.3)
     plt.title(f'Lap Time Progression - {track_name}', fontsize=16)
     plt.xlabel('Lap', fontsize=12)
     plt.ylabel('Lap Time (seconds)', fontsize=12)
-    plt.legend()
+    plt.legend(handles=[Line2D([0], [0], color=color, linewidth=1.5, alpha=0.8,
+                               label=f"{driver.name} ({driver.team})")
+                        for driver, color in zip(top_drivers, driver_colors)])
     
     # Add shaded areas for different race phases
     plt.axvspan(0, laps * 0.1, alpha=0.1, color='green', label='Start Phase')
@@ -261,7 +301,7 @@ def plot_lap_time_progression(results, laps, track_name):
     # Create filename with the new format
     filename = get_formatted_filename("lap_time", track_name) + ".png"
     save_path = os.path.join(GRAPH_DIR, filename)
-    plt.savefig(save_path, dpi=300)
+    plt.savefig(save_path, dpi=DEFAULT_DPI)
     return save_path
 
 def plot_driver_comparison(results, track_name):
@@ -290,11 +330,8 @@ def plot_driver_comparison(results, track_name):
             'Points': r.points
         })
     
-    # Convert to DataFrame for easier plotting
-    df = pd.DataFrame(drivers)
-    
     # Create a radar chart for top 5 drivers
-    plt.figure(figsize=(12, 10))
+    _reset_figure((10, 8))
     
     # Radar chart attributes
     categories = ['Skill', 'Consistency', 'Overtaking', 'Points', 'Start']
@@ -338,17 +375,19 @@ def plot_driver_comparison(results, track_name):
     # Create filename with the new format
     filename = get_formatted_filename("driver_radar", track_name) + ".png"
     save_path = os.path.join(GRAPH_DIR, filename)
-    plt.savefig(save_path, dpi=300)
+    plt.savefig(save_path, dpi=DEFAULT_DPI)
     
     # Additional bar chart comparing position gains/losses
-    plt.figure(figsize=(12, 6))
+    _reset_figure((12, 6))
     
     # Sort by position for better readability
-    df_sorted = df.sort_values('Position')
+    drivers_sorted = sorted(drivers, key=lambda d: d['Position'])
+    names = [d['Name'] for d in drivers_sorted]
+    gains = [d['Gain/Loss'] for d in drivers_sorted]
     
     # Bar chart for position changes
-    colors = ['green' if x > 0 else 'red' if x < 0 else 'gray' for x in df_sorted['Gain/Loss']]
-    plt.bar(df_sorted['Name'], df_sorted['Gain/Loss'], color=colors)
+    colors = ['green' if x > 0 else 'red' if x < 0 else 'gray' for x in gains]
+    plt.bar(names, gains, color=colors)
     
     plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
     plt.title('Position Gains/Losses During Race', size=16)
@@ -362,7 +401,7 @@ def plot_driver_comparison(results, track_name):
     # Create filename with the new format
     filename2 = get_formatted_filename("position_changes", track_name) + ".png"
     save_path2 = os.path.join(GRAPH_DIR, filename2)
-    plt.savefig(save_path2, dpi=300)
+    plt.savefig(save_path2, dpi=DEFAULT_DPI)
     
     return save_path, save_path2
 
@@ -374,47 +413,31 @@ def plot_team_performance(results, track_name):
         results: List of race results
         track_name: Name of the track
     """
-    # Extract team data
-    teams = {}
-    
-    for result in results:
-        team_name = result.team.name
-        if team_name not in teams:
-            teams[team_name] = {
-                'Points': 0,
-                'BestPosition': float('inf'),
-                'Drivers': [],
-                'DriverPositions': [],
-                'CarPerformance': result.team.performance,
-                'Reliability': result.team.reliability
-            }
-        
-        # Update team stats
-        teams[team_name]['Points'] += result.points
-        teams[team_name]['BestPosition'] = min(teams[team_name]['BestPosition'], result.finishing_position)
-        teams[team_name]['Drivers'].append(result.driver.name)
-        teams[team_name]['DriverPositions'].append(result.finishing_position)
-    
-    # Convert to DataFrame
-    team_data = []
-    for team_name, stats in teams.items():
-        team_data.append({
-            'Team': team_name,
-            'Points': stats['Points'],
-            'BestPosition': stats['BestPosition'] if stats['BestPosition'] != float('inf') else 20,
-            'AvgPosition': sum(stats['DriverPositions']) / len(stats['DriverPositions']),
-            'CarPerformance': stats['CarPerformance'],
-            'Reliability': stats['Reliability'],
-            'Drivers': ', '.join(stats['Drivers'])
-        })
-    
-    team_df = pd.DataFrame(team_data)
+    # Extract team data, one row per driver
+    results_df = pd.DataFrame({
+        'Team': [r.team.name for r in results],
+        'Points': [r.points for r in results],
+        'Position': [r.finishing_position for r in results],
+        'CarPerformance': [r.team.performance for r in results],
+        'Reliability': [r.team.reliability for r in results],
+        'Driver': [r.driver.name for r in results]
+    })
+    
+    # Aggregate per team, keeping teams in order of first appearance
+    team_df = results_df.groupby('Team', sort=False).agg(
+        Points=('Points', 'sum'),
+        BestPosition=('Position', 'min'),
+        AvgPosition=('Position', 'mean'),
+        CarPerformance=('CarPerformance', 'first'),
+        Reliability=('Reliability', 'first'),
+        Drivers=('Driver', ', '.join)
+    ).reset_index()
     
     # Sort by points for better display
     team_df = team_df.sort_values('Points', ascending=False)
     
     # Team Performance Heatmap
-    plt.figure(figsize=(12, 8))
+    _reset_figure((12, 8))
     
     # Prepare data for heatmap
     heatmap_data = team_df[['Team', 'CarPerformance', 'Reliability', 'Points']]
@@ -427,27 +450,13 @@ def plot_team_performance(results, track_name):
     # Create filename with the new format
     filename = get_formatted_filename("team_heatmap", track_name) + ".png"
     save_path = os.path.join(GRAPH_DIR, filename)
-    plt.savefig(save_path, dpi=300)
+    plt.savefig(save_path, dpi=DEFAULT_DPI)
     
     # Team Points Bar Chart
-    plt.figure(figsize=(12, 6))
-    
-    # Team colors
-    team_colors = {
-        'Red Bull Racing': '#0600EF',  # Dark blue
-        'Ferrari': '#DC0000',          # Red
-        'Mercedes': '#00D2BE',         # Teal
-        'McLaren': '#FF8700',          # Orange
-        'Aston Martin': '#006F62',     # Green
-        'Alpine': '#0090FF',           # Blue
-        'Williams': '#005AFF',         # Blue
-        'Racing Bulls': '#052C5A',     # Navy
-        'Kick Sauber': '#52E252',      # Green
-        'Haas': '#FFFFFF'              # White
-    }
+    _reset_figure((12, 6))
     
     # Create color list matching the order of teams in the DataFrame
-    colors = [team_colors.get(team, '#333333') for team in team_df['Team']]
+    colors = [TEAM_COLORS.get(team, '#333333') for team in team_df['Team']]
     
     # Create the bar chart
     plt.bar(team_df['Team'], team_df['Points'], color=colors)
@@ -466,10 +475,17 @@ def plot_team_performance(results, track_name):
     # Create filename with the new format
     filename2 = get_formatted_filename("team_points", track_name) + ".png"
     save_path2 = os.path.join(GRAPH_DIR, filename2)
-    plt.savefig(save_path2, dpi=300)
+    plt.savefig(save_path2, dpi=DEFAULT_DPI)
     
     return save_path, save_path2
 
+def _race_key(results, laps, track_name):
+    """Hash the race inputs the graphs and their file names depend on."""
+    race = tuple((r.driver.name, r.team.name, r.starting_position, r.finishing_position,
+                  r.status, r.points) for r in results)
+    key_source = repr((track_name, laps, DEFAULT_DPI, datetime.date.today().isoformat(), race))
+    return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+
 def generate_all_visualizations(results, laps, track_name):
     """
     Generate all visualization types and return paths to saved files.
@@ -482,6 +498,18 @@ def generate_all_visualizations(results, laps, track_name):
     Returns:
         Dictionary of paths to generated visualization files
     """
+    global _LAST_VISUALIZATIONS
+    
+    # Asking again for the same race on the same day (e.g. from the analysis
+    # menu) returns the graphs already saved for it, as long as they still
+    # exist. The charts include random draws, so this keeps the first set
+    race_key = _race_key(results, laps, track_name)
+    if _LAST_VISUALIZATIONS is not None and _LAST_VISUALIZATIONS[0] == race_key:
+        paths = _LAST_VISUALIZATIONS[1]
+        if all(os.path.exists(path) for path in paths.values()):
+            print("Reusing the graphs already saved for this race...")
+            return dict(paths)
+    
     visualizations = {}
     
     print("Generating tire degradation chart...")
@@ -500,4 +528,5 @@ def generate_all_visualizations(results, laps, track_name):
     visualizations['team_heatmap'] = team_heatmap
     visualizations['team_points'] = team_points
     
-    return visualizations
\ No newline at end of file
+    _LAST_VISUALIZATIONS = (race_key, dict(visualizations))
+    return visualizations